@@ -11,6 +11,8 @@ CRITICAL RULES:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import threading
 import time
 from typing import Dict, Any, Optional
 from batch2_engine.response_models import APIResponse
@@ -32,7 +34,8 @@ class CoinGlassAPI:
     
     BASE_URL = "https://open-api-v4.coinglass.com"
     
-    def __init__(self, api_key: str, timeout: int = 30, rate_limit_delay: float = 0.1):
+    def __init__(self, api_key: str, timeout: int = 30, rate_limit_delay: float = 0.1,
+                 max_connections: int = 20):
         """
         Initialize CoinGlass API client
         
@@ -40,14 +43,20 @@ class CoinGlassAPI:
             api_key: CoinGlass API key
             timeout: Request timeout in seconds (default 30)
             rate_limit_delay: Minimum delay between requests in seconds (default 0.1)
+            max_connections: Keep-alive connections kept per host (default 20);
+                should cover the orchestrator's max_workers
         """
         self.api_key = api_key
         self.timeout = timeout
         self.rate_limit_delay = rate_limit_delay
         self.last_request_time = 0
+        self._rate_lock = threading.Lock()
         
-        # Session for connection pooling
+        # Session for connection pooling. requests' default adapter keeps at
+        # most 10 idle connections per host and discards extras after use, so
+        # with more concurrent workers those would pay a new TCP+TLS handshake.
         self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=max_connections))
         self.session.headers.update({
             "CG-API-KEY": api_key,  # CoinGlass v4 uses this header
             "Content-Type": "application/json"
@@ -57,16 +66,17 @@ class CoinGlassAPI:
         """
         Simple rate limiting
         
-        Ensures minimum delay between requests
+        Ensures minimum delay between requests (serialized across threads)
         """
-        now = time.time()
-        time_since_last = now - self.last_request_time
-        
-        if time_since_last < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+        with self._rate_lock:
+            now = time.time()
+            time_since_last = now - self.last_request_time
+            
+            if time_since_last < self.rate_limit_delay:
+                sleep_time = self.rate_limit_delay - time_since_last
+                time.sleep(sleep_time)
+            
+            self.last_request_time = time.time()
     
     def fetch(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> APIResponse:
         """
@@ -13,6 +13,10 @@ from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
 
+# Body-level success codes returned by CoinGlass v4 ("code" field)
+_SUCCESS_CODES = frozenset({"0", "00", "success"})
+
+
 @dataclass
 class APIResponse:
     """
@@ -89,10 +93,12 @@ class APIResponse:
             )
         
         # Step 3: Check body "code" field (CRITICAL for v4)
-        body_code = str(data.get("code", ""))
+        body_code = data.get("code", "")
+        if type(body_code) is not str:
+            body_code = str(body_code)
         
         # Success codes: "0", "00", "success"
-        if body_code in ("0", "00", "success"):
+        if body_code in _SUCCESS_CODES:
             return cls(
                 data=data,
                 status_code=status_code,
@@ -30,7 +30,290 @@ CONTRACT GUARANTEES:
 5. Timestamps are always integer epoch-seconds
 """
 
-from typing import Dict, Any, Optional, List
+import heapq
+import math
+from bisect import bisect_left, bisect_right
+from functools import lru_cache, wraps
+from operator import itemgetter, truediv
+from statistics import fmean, pstdev
+from typing import Dict, Any, Callable, Optional, List, Sequence, Tuple
+
+from batch2_engine.response_models import _SUCCESS_CODES
+
+
+# Time window constants (API timestamps are milliseconds)
+_DAY_MS = 86_400_000                 # milliseconds per day
+_SEVEN_DAYS_MS = 7 * _DAY_MS         # 7d lookback used by weekly change_7d
+_MS_THRESHOLD = 1_000_000_000_000    # epoch values above this are milliseconds
+
+
+
+# ============================================================================
+# PARSE HELPERS (shared by per-row build loops)
+# ============================================================================
+
+def _is_ok(payload: Dict[str, Any]) -> bool:
+    """
+    True if a raw v4 payload reports success in its "code" field
+
+    The API sends code as a string, so that case skips the str() coercion;
+    anything else (e.g. an int 0 from a mock) is coerced as before.
+    """
+    code = payload.get("code", "")
+    if type(code) is str:
+        return code in _SUCCESS_CODES
+    return str(code) in _SUCCESS_CODES
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """
+    Coerce an API numeric field to float, None if it cannot be parsed
+
+    Fast path: values that are already float/int (the common case) are
+    validated by exact type check, so no exception frame is set up per row.
+    Only strings and other types fall back to float() inside try/except.
+    """
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _to_int(value: Any) -> Optional[int]:
+    """
+    Coerce an API timestamp field to int, None if it cannot be parsed
+
+    Same fast path as _to_float: exact int skips the try/except entirely.
+    """
+    if type(value) is int:
+        return value
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+# Row field getters for the per-row parse loops (one C call per row).
+# A missing key (KeyError) or a None/unparseable value (TypeError/ValueError)
+# skips the row - the same rows the _to_int/_to_float None checks skip.
+_get_time_close = itemgetter("time", "close")
+_get_time_long_short = itemgetter(
+    "time", "aggregated_long_liquidation_usd", "aggregated_short_liquidation_usd"
+)
+_get_time_buy_sell = itemgetter(
+    "time", "aggregated_buy_volume_usd", "aggregated_sell_volume_usd"
+)
+_ROW_SKIP_ERRORS = (KeyError, TypeError, ValueError)
+
+
+# ============================================================================
+# DATE HELPERS
+# ============================================================================
+
+def _to_seconds(ts: int) -> int:
+    """
+    Epoch timestamp in seconds, accepting either seconds or milliseconds
+
+    Values above _MS_THRESHOLD are treated as milliseconds. Int-only compare.
+    """
+    return ts // 1000 if ts > _MS_THRESHOLD else ts
+
+
+def _utc_iso_date(ts_sec: int) -> str:
+    """
+    Format epoch-seconds as a UTC "YYYY-MM-DD" string
+
+    Integer civil-from-days conversion (H. Hinnant) - same calendar day as
+    datetime.fromtimestamp(ts_sec, tz=timezone.utc).strftime("%Y-%m-%d")
+    without building a datetime or parsing a format string. Year is always
+    zero-padded to 4 digits.
+
+    Raises:
+        ValueError if the date falls outside years 1..9999 (datetime's range)
+    """
+    return _epoch_day_iso(ts_sec // 86400)
+
+
+def _utc_iso_date_ms(ts_ms: Any) -> str:
+    """
+    _utc_iso_date for an epoch-milliseconds value, "" if it cannot be formatted
+    """
+    try:
+        return _utc_iso_date(int(ts_ms) // 1000)
+    except Exception:
+        return ""
+
+
+@lru_cache(maxsize=4096)
+def _epoch_day_iso(days: int) -> str:
+    """
+    "YYYY-MM-DD" for a day number since 1970-01-01 (see _utc_iso_date)
+
+    Cached per day: the monthly normalizers in one run mostly resolve to the
+    same few UTC days.
+    """
+    z = days + 719468
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = mp + 3 if mp < 10 else mp - 9
+    year = yoe + era * 400 + (month <= 2)
+    if not 1 <= year <= 9999:
+        raise ValueError("date out of range")
+    return "%04d-%02d-%02d" % (year, month, day)
+
+
+# ============================================================================
+# PAYLOAD MEMOIZATION (paired wrappers share one base computation)
+# ============================================================================
+
+# Every function wrapped by _memoize_last_payload (for clear_payload_caches)
+_MEMOIZED: List[Callable[[Any], Any]] = []
+
+
+def _memoize_last_payload(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """
+    Cache the result for the most recent payload object (identity match)
+
+    Paired wrappers (long/short liquidations, volume/perp change) are called
+    back-to-back with the same raw payload; the second call reuses the parsed
+    base instead of re-parsing and re-sorting it.
+
+    The cached payload is held by strong reference, so its id() can never be
+    recycled for a different object while the entry is live. Payloads are
+    treated as read-only once fetched. wrapper.cache_clear() drops the entry
+    (see clear_payload_caches).
+    """
+    last = [None]  # (payload, result) of the latest call
+
+    @wraps(func)
+    def wrapper(data):
+        entry = last[0]
+        if entry is not None and entry[0] is data:
+            return entry[1]
+        result = func(data)
+        last[0] = (data, result)
+        return result
+
+    def cache_clear():
+        last[0] = None
+
+    wrapper.cache_clear = cache_clear
+    _MEMOIZED.append(wrapper)
+    return wrapper
+
+
+def clear_payload_caches() -> None:
+    """
+    Drop every memoized payload/result pair
+
+    Call at a batch boundary so the last raw payloads are not kept alive
+    until the next batch overwrites them.
+    """
+    for memoized in _MEMOIZED:
+        memoized.cache_clear()
+
+
+# ============================================================================
+# WEEK-OVER-WEEK WINDOW HELPERS (shared by 14-bar weekly normalizers)
+# ============================================================================
+
+def _ok_data_list(data: Dict[str, Any], min_len: int) -> Optional[List[Any]]:
+    """
+    Success-code check plus the payload's "data" list
+
+    Returns:
+        The data list, or None if the code is bad or it has < min_len rows
+    """
+    if not _is_ok(data):
+        return None
+
+    data_list = data.get("data", [])
+    if not data_list or len(data_list) < min_len:
+        return None
+
+    return data_list
+
+
+def _sorted_last_14(rows: List[tuple]) -> List[tuple]:
+    """
+    Sort (ts, ...) tuples by timestamp ascending and keep the newest 14
+
+    Caller guarantees len(rows) >= 14. Inputs are documented ASC, which
+    Timsort recognises in one linear pass; itemgetter keeps the key calls
+    in C.
+    """
+    return sorted(rows, key=itemgetter(0))[-14:]
+
+
+def _sorted_last_14_of_many(rows: List[tuple]) -> List[tuple]:
+    """
+    Same result as _sorted_last_14, for long histories (thousands of rows)
+
+    heapq.nlargest selects the newest 14 in O(n log 14) instead of sorting
+    everything. Feeding it reversed input and reversing the output keeps the
+    exact order _sorted_last_14 produces, including rows with equal timestamps.
+    """
+    last_14 = heapq.nlargest(14, reversed(rows), key=itemgetter(0))
+    last_14.reverse()
+    return last_14
+
+
+def _week_sums(values: Sequence[float]) -> Tuple[float, float]:
+    """
+    Split a 14-value window into its two 7-day halves and sum each
+
+    Returns:
+        (prev7_sum, curr7_sum) - older week first, newest week second
+    """
+    return sum(values[:7]), sum(values[7:])
+
+
+def _week_means(values: List[float]) -> Tuple[float, float]:
+    """
+    Same split as _week_sums, averaged with statistics.fmean
+
+    Returns:
+        (prev7_avg, curr7_avg) - older week first, newest week second
+    """
+    return fmean(values[:7]), fmean(values[7:])
+
+
+def _weekly_output(value: float, change_7d: float) -> Dict[str, float]:
+    """
+    Build the {"value", "change_7d"} weekly payload, rounded to 2 decimals
+
+    Single rounding point for the paired base wrappers (weekly_06/07/13/14).
+    """
+    return {"value": round(value, 2), "change_7d": round(change_7d, 2)}
+
+
+# ============================================================================
+# LATEST CLOSE HELPER (shared by daily_01/daily_04)
+# ============================================================================
+
+def _latest_close(data: Dict[str, Any]) -> Optional[float]:
+    """
+    Float close of the last row in data["data"], None if missing/unparseable
+
+    Caller has already checked the success code.
+    """
+    data_list = data.get("data", [])
+    if not data_list:
+        return None
+    return _to_float(data_list[-1].get("close"))
 
 
 # ============================================================================
@@ -68,27 +351,14 @@ def normalize_total_oi(data: Dict[str, Any]) -> Optional[float]:
     """
     try:
         # Check success code
-        code = str(data.get("code", ""))
-        if code not in ("0", "00", "success"):
+        if not _is_ok(data):
             return None
         
-        # Extract data list
-        data_list = data.get("data", [])
-        if not data_list:
-            return None
-        
-        # Get latest datapoint (last item in list)
-        latest = data_list[-1]
-        
-        # Get close value (total OI)
-        close_value = latest.get("close")
+        # Get close value of latest datapoint (total OI)
+        close_value = _latest_close(data)
         if close_value is None:
             return None
         
-        # Convert to float if string
-        if isinstance(close_value, str):
-            close_value = float(close_value)
-        
         # Validate
         if close_value <= 0:
             return None
@@ -102,44 +372,36 @@ def normalize_total_oi(data: Dict[str, Any]) -> Optional[float]:
 
 
 # ============================================================================
-# NORMALIZER 2: OI Change 1h (daily_02)
+# OI CHANGE HELPERS (shared by daily_02/daily_03)
 # ============================================================================
 
-def normalize_oi_change_1h(data: Dict[str, Any]) -> Optional[float]:
+def _two_latest(pairs: List[tuple]) -> Tuple[tuple, tuple]:
     """
-    Calculate 1-hour percentage change in open interest
+    Return (prev, latest) - the two newest (ts, ...) tuples - in one pass
 
-    Metric: daily_02_oi_change_1h
-    Endpoint: /api/futures/open-interest/aggregated-history
-    Params: interval=1h, limit=2, symbol=BTC
-
-    V4 Response Format (can be ASC or DESC):
-        {"code": "0", "data": [
-            {"time": 1768546800000, "close": 62100000000.0},
-            {"time": 1768550400000, "close": 62342795495.894}
-        ]}
+    Same result as sorted(pairs)[-2:] on timestamp (ties resolve to the later
+    row, like a stable sort), without building a sorted copy.
+    Caller guarantees len(pairs) >= 2.
+    """
+    prev = latest = None
+    for pair in pairs:
+        if latest is None or pair[0] >= latest[0]:
+            prev, latest = latest, pair
+        elif prev is None or pair[0] >= prev[0]:
+            prev = pair
+    return prev, latest
 
-    CRITICAL: Data ordering can vary (ASC or DESC).
-    Must sort by timestamp and pick last 2 valid points.
 
-    Args:
-        data: Raw API response with 2+ datapoints
+def _oi_pct_change(data: Dict[str, Any]) -> Optional[float]:
+    """
+    Percent change between the two newest OI closes (shared by daily_02/03)
 
     Returns:
-        Float percent change (e.g., 2.45 for +2.45%, -1.23 for -1.23%)
-        None if error or insufficient data
-
-    Logic:
-        1. Filter valid (time, close) pairs
-        2. Sort by timestamp ascending
-        3. Take last 2 points (prev, latest)
-        4. Calculate: ((latest - prev) / prev) * 100
-        5. Round to 2 decimals
+        Float percent change rounded to 2 decimals, None on error
     """
     try:
         # Check success code
-        code = str(data.get("code", ""))
-        if code not in ("0", "00", "success"):
+        if not _is_ok(data):
             return None
 
         # Extract data list
@@ -150,26 +412,19 @@ def normalize_oi_change_1h(data: Dict[str, Any]) -> Optional[float]:
         # Build valid (time, close) pairs - filter out invalid rows
         pairs = []
         for row in data_list:
-            ts = row.get("time")
-            close = row.get("close")
-            if ts is None or close is None:
-                continue
             try:
-                close_val = float(close)
-                if close_val > 0:
-                    pairs.append((int(ts), close_val))
-            except (ValueError, TypeError):
+                ts, close_val = _get_time_close(row)
+                ts, close_val = int(ts), float(close_val)
+            except _ROW_SKIP_ERRORS:
                 continue
+            if close_val > 0:
+                pairs.append((ts, close_val))
 
         if len(pairs) < 2:
             return None
 
-        # Sort by timestamp ascending
-        pairs_sorted = sorted(pairs, key=lambda x: x[0])
-
-        # Take last 2 points
-        prev_ts, prev_value = pairs_sorted[-2]
-        latest_ts, latest_value = pairs_sorted[-1]
+        # Two newest points by timestamp (prev, latest)
+        (prev_ts, prev_value), (latest_ts, latest_value) = _two_latest(pairs)
 
         # Calculate percent change
         percent_change = ((latest_value - prev_value) / prev_value) * 100
@@ -180,16 +435,22 @@ def normalize_oi_change_1h(data: Dict[str, Any]) -> Optional[float]:
 
 
 # ============================================================================
-# NORMALIZER 3: OI Change 4h (daily_03)
+# NORMALIZER 2: OI Change 1h (daily_02)
 # ============================================================================
 
-def normalize_oi_change_4h(data: Dict[str, Any]) -> Optional[float]:
+def normalize_oi_change_1h(data: Dict[str, Any]) -> Optional[float]:
     """
-    Calculate 4-hour percentage change in open interest
+    Calculate 1-hour percentage change in open interest
 
-    Metric: daily_03_oi_change_4h
+    Metric: daily_02_oi_change_1h
     Endpoint: /api/futures/open-interest/aggregated-history
-    Params: interval=4h, limit=2, symbol=BTC
+    Params: interval=1h, limit=2, symbol=BTC
+
+    V4 Response Format (can be ASC or DESC):
+        {"code": "0", "data": [
+            {"time": 1768546800000, "close": 62100000000.0},
+            {"time": 1768550400000, "close": 62342795495.894}
+        ]}
 
     CRITICAL: Data ordering can vary (ASC or DESC).
     Must sort by timestamp and pick last 2 valid points.
@@ -198,52 +459,43 @@ def normalize_oi_change_4h(data: Dict[str, Any]) -> Optional[float]:
         data: Raw API response with 2+ datapoints
 
     Returns:
-        Float percent change
+        Float percent change (e.g., 2.45 for +2.45%, -1.23 for -1.23%)
         None if error or insufficient data
 
-    Logic: Same as normalize_oi_change_1h - timestamp-safe
+    Logic:
+        1. Filter valid (time, close) pairs
+        2. Pick the 2 newest points by timestamp (prev, latest)
+        3. Calculate: ((latest - prev) / prev) * 100
+        4. Round to 2 decimals
     """
-    try:
-        # Check success code
-        code = str(data.get("code", ""))
-        if code not in ("0", "00", "success"):
-            return None
+    return _oi_pct_change(data)
 
-        # Extract data list
-        data_list = data.get("data", [])
-        if len(data_list) < 2:
-            return None
 
-        # Build valid (time, close) pairs - filter out invalid rows
-        pairs = []
-        for row in data_list:
-            ts = row.get("time")
-            close = row.get("close")
-            if ts is None or close is None:
-                continue
-            try:
-                close_val = float(close)
-                if close_val > 0:
-                    pairs.append((int(ts), close_val))
-            except (ValueError, TypeError):
-                continue
+# ============================================================================
+# NORMALIZER 3: OI Change 4h (daily_03)
+# ============================================================================
 
-        if len(pairs) < 2:
-            return None
+def normalize_oi_change_4h(data: Dict[str, Any]) -> Optional[float]:
+    """
+    Calculate 4-hour percentage change in open interest
 
-        # Sort by timestamp ascending
-        pairs_sorted = sorted(pairs, key=lambda x: x[0])
+    Metric: daily_03_oi_change_4h
+    Endpoint: /api/futures/open-interest/aggregated-history
+    Params: interval=4h, limit=2, symbol=BTC
 
-        # Take last 2 points
-        prev_ts, prev_value = pairs_sorted[-2]
-        latest_ts, latest_value = pairs_sorted[-1]
+    CRITICAL: Data ordering can vary (ASC or DESC).
+    Must sort by timestamp and pick last 2 valid points.
 
-        # Calculate percent change
-        percent_change = ((latest_value - prev_value) / prev_value) * 100
-        return round(percent_change, 2)
+    Args:
+        data: Raw API response with 2+ datapoints
 
-    except Exception:
-        return None
+    Returns:
+        Float percent change
+        None if error or insufficient data
+
+    Logic: Same as normalize_oi_change_1h - timestamp-safe
+    """
+    return _oi_pct_change(data)
 
 
 # ============================================================================
@@ -278,26 +530,14 @@ def normalize_weighted_funding(data: Dict[str, Any]) -> Optional[float]:
     """
     try:
         # Check success code
-        code = str(data.get("code", ""))
-        if code not in ("0", "00", "success"):
+        if not _is_ok(data):
             return None
         
-        # Extract data list
-        data_list = data.get("data", [])
-        if not data_list:
+        # Get close value of latest datapoint (funding rate)
+        rate_value = _latest_close(data)
+        if rate_value is None:
             return None
         
-        # Get latest datapoint
-        latest = data_list[-1]
-        
-        # Get close value (funding rate)
-        funding_rate = latest.get("close")
-        if funding_rate is None:
-            return None
-        
-        # Convert to float
-        rate_value = float(funding_rate)
-        
         # If value is very small (< 1), assume it's already in decimal form
         # Multiply by 100 to get percentage
         if abs(rate_value) < 1:
@@ -346,8 +586,7 @@ def normalize_funding_history(data: Dict[str, Any]) -> Optional[List[Dict[str, A
     """
     try:
         # Check success code
-        code = str(data.get("code", ""))
-        if code not in ("0", "00", "success"):
+        if not _is_ok(data):
             return None
         
         # Extract data list
@@ -355,7 +594,8 @@ def normalize_funding_history(data: Dict[str, Any]) -> Optional[List[Dict[str, A
         if len(data_list) < 5:  # Minimum threshold
             return None
         
-        history = []
+        # Parse each row once into (timestamp, percent) tuples
+        points = []
         for datapoint in data_list:
             # Extract timestamp (convert ms to seconds)
             timestamp_ms = datapoint.get("time")
@@ -369,26 +609,23 @@ def normalize_funding_history(data: Dict[str, Any]) -> Optional[List[Dict[str, A
             if rate is None:
                 continue
             
-            # Convert rate to percentage
-            rate_value = float(rate)
+            # Convert rate to percentage (unparseable rate fails the metric)
+            rate_value = _to_float(rate)
+            if rate_value is None:
+                return None
             if abs(rate_value) < 1:
-                rate_percent = rate_value * 100
-            else:
-                rate_percent = rate_value
+                rate_value *= 100
             
-            history.append({
-                "timestamp": timestamp,
-                "value": round(rate_percent, 4)
-            })
+            points.append((timestamp, round(rate_value, 4)))
         
         # Validate we have enough datapoints
-        if len(history) < 5:
+        if len(points) < 5:
             return None
         
-        # Sort by timestamp (oldest to newest)
-        history.sort(key=lambda x: x["timestamp"])
+        # Sort by timestamp (oldest to newest), then build output dicts once
+        points.sort(key=itemgetter(0))
         
-        return history
+        return [{"timestamp": ts, "value": value} for ts, value in points]
         
     except Exception:
         return None
@@ -398,6 +635,20 @@ def normalize_funding_history(data: Dict[str, Any]) -> Optional[List[Dict[str, A
 # NORMALIZER 6: Long/Short Ratio Global (daily_06)
 # ============================================================================
 
+def _long_short_output(long_value: float, short_value: float, ratio: float) -> Dict[str, float]:
+    """
+    Build the {"long", "short", "ratio"} payload shared by daily_06/daily_07
+
+    Plain dict on purpose: the JSON contract and TextFormatter both consume
+    dict values, so a NamedTuple would serialize as a list.
+    """
+    return {
+        "long": round(long_value, 2),
+        "short": round(short_value, 2),
+        "ratio": round(ratio, 3)
+    }
+
+
 def normalize_long_short_global(data: Dict[str, Any]) -> Optional[Dict[str, float]]:
     """
     Extract global long/short account ratio
@@ -432,8 +683,7 @@ def normalize_long_short_global(data: Dict[str, Any]) -> Optional[Dict[str, floa
     """
     try:
         # Check success code
-        code = str(data.get("code", ""))
-        if code not in ("0", "00", "success"):
+        if not _is_ok(data):
             return None
         
         # Extract data list
@@ -465,11 +715,7 @@ def normalize_long_short_global(data: Dict[str, Any]) -> Optional[Dict[str, floa
         else:
             ratio_value = long_value / short_value
         
-        return {
-            "long": round(long_value, 2),
-            "short": round(short_value, 2),
-            "ratio": round(ratio_value, 3)
-        }
+        return _long_short_output(long_value, short_value, ratio_value)
         
     except Exception:
         return None
@@ -499,8 +745,7 @@ def normalize_long_short_hyperliquid(data: Dict[str, Any]) -> Optional[Dict[str,
     """
     try:
         # Check success code
-        code = str(data.get("code", ""))
-        if code not in ("0", "00", "success"):
+        if not _is_ok(data):
             return None
         
         # Extract data list
@@ -528,11 +773,7 @@ def normalize_long_short_hyperliquid(data: Dict[str, Any]) -> Optional[Dict[str,
         
         ratio = long_value / short_value
         
-        return {
-            "long": round(long_value, 2),
-            "short": round(short_value, 2),
-            "ratio": round(ratio, 3)
-        }
+        return _long_short_output(long_value, short_value, ratio)
         
     except Exception:
         return None
@@ -542,6 +783,42 @@ def normalize_long_short_hyperliquid(data: Dict[str, Any]) -> Optional[Dict[str,
 # NORMALIZER 8: 24h Liquidations Total (daily_08)
 # ============================================================================
 
+# Liquidation field names - new schema first, then legacy fallbacks
+_LONG_LIQ_KEYS = (
+    "aggregated_long_liquidation_usd",
+    "longLiquidationUsd",
+    "longLiquidation",
+    "longVolUsd",
+)
+_SHORT_LIQ_KEYS = (
+    "aggregated_short_liquidation_usd",
+    "shortLiquidationUsd",
+    "shortLiquidation",
+    "shortVolUsd",
+)
+
+
+# Event normalizer (daily_09) never read the *VolUsd legacy fields
+_LONG_EVENT_KEYS = _LONG_LIQ_KEYS[:3]
+_SHORT_EVENT_KEYS = _SHORT_LIQ_KEYS[:3]
+
+
+def _first_present(row: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """
+    Return the value of the first key present (non-None, non-empty) in row, else 0
+
+    A present 0 / 0.0 / "0" is a real reading and is returned as-is; it does not
+    fall through to the next (legacy) key the way an `a or b or ...` chain does.
+    An empty string is treated like a missing field, so a blank new-schema key
+    still falls back to the legacy key instead of failing float conversion.
+    """
+    for key in keys:
+        value = row.get(key)
+        if value is not None and value != "":
+            return value
+    return 0
+
+
 def normalize_liquidations_total(data: Dict[str, Any]) -> Optional[Dict[str, float]]:
     """
     Calculate 24-hour liquidation summary (long/short/total)
@@ -579,8 +856,7 @@ def normalize_liquidations_total(data: Dict[str, Any]) -> Optional[Dict[str, flo
     """
     try:
         # Check success code
-        code = str(data.get("code", ""))
-        if code not in ("0", "00", "success"):
+        if not _is_ok(data):
             return None
         
         # Extract data list
@@ -588,30 +864,16 @@ def normalize_liquidations_total(data: Dict[str, Any]) -> Optional[Dict[str, flo
         if len(data_list) < 6:
             return None
         
-        total_long_usd = 0.0
-        total_short_usd = 0.0
+        # Extract long/short columns once (use only first 6 datapoints)
+        window = data_list[:6]
+        longs = [_to_float(_first_present(dp, _LONG_LIQ_KEYS)) for dp in window]
+        shorts = [_to_float(_first_present(dp, _SHORT_LIQ_KEYS)) for dp in window]
+        if None in longs or None in shorts:
+            return None
         
         # Sum liquidations across all 6 datapoints
-        for datapoint in data_list[:6]:  # Use only first 6
-            # Long liquidations - new schema first, then legacy fallback
-            long_value = (
-                datapoint.get("aggregated_long_liquidation_usd") or
-                datapoint.get("longLiquidationUsd") or
-                datapoint.get("longLiquidation") or
-                datapoint.get("longVolUsd") or
-                0
-            )
-            total_long_usd += float(long_value)
-
-            # Short liquidations - new schema first, then legacy fallback
-            short_value = (
-                datapoint.get("aggregated_short_liquidation_usd") or
-                datapoint.get("shortLiquidationUsd") or
-                datapoint.get("shortLiquidation") or
-                datapoint.get("shortVolUsd") or
-                0
-            )
-            total_short_usd += float(short_value)
+        total_long_usd = sum(longs, 0.0)
+        total_short_usd = sum(shorts, 0.0)
         
         # Calculate total
         total_usd = total_long_usd + total_short_usd
@@ -671,14 +933,12 @@ def normalize_liquidation_events(data: Dict[str, Any]) -> Optional[List[Dict[str
     Logic:
         1. Extract all liquidation datapoints
         2. Create events from long/short values
-        3. Sort by amount (descending)
-        4. Take top 10
-        5. Return list with timestamp, side, amount, exchange
+        3. Select top 10 by amount (descending)
+        4. Return list with timestamp, side, amount, exchange
     """
     try:
         # Check success code
-        code = str(data.get("code", ""))
-        if code not in ("0", "00", "success"):
+        if not _is_ok(data):
             return None
         
         # Extract data list
@@ -697,48 +957,32 @@ def normalize_liquidation_events(data: Dict[str, Any]) -> Optional[List[Dict[str
             timestamp = int(timestamp_ms) // 1000  # Convert to seconds
 
             # Create events - new schema first, then legacy fallback
-            long_value = (
-                datapoint.get("aggregated_long_liquidation_usd") or
-                datapoint.get("longLiquidationUsd") or
-                datapoint.get("longLiquidation") or
-                0
-            )
-            short_value = (
-                datapoint.get("aggregated_short_liquidation_usd") or
-                datapoint.get("shortLiquidationUsd") or
-                datapoint.get("shortLiquidation") or
-                0
-            )
+            long_value = _first_present(datapoint, _LONG_EVENT_KEYS)
+            short_value = _first_present(datapoint, _SHORT_EVENT_KEYS)
             
+            # (amount_millions, timestamp, side) - dicts are built for the top 10 only
             if long_value > 0:
-                all_events.append({
-                    "timestamp": timestamp,
-                    "side": "long",
-                    "amount": float(long_value) / 1e6,  # Convert to millions
-                    "exchange": "Aggregated"
-                })
+                all_events.append((_to_float(long_value) / 1e6, timestamp, "long"))
             
             if short_value > 0:
-                all_events.append({
-                    "timestamp": timestamp,
-                    "side": "short",
-                    "amount": float(short_value) / 1e6,
-                    "exchange": "Aggregated"
-                })
+                all_events.append((_to_float(short_value) / 1e6, timestamp, "short"))
         
         # Validate we have events
         if not all_events:
             return None
         
-        # Sort by amount (descending) and take top 10
-        all_events.sort(key=lambda x: x["amount"], reverse=True)
-        top_10 = all_events[:10]
-        
-        # Round amounts
-        for event in top_10:
-            event["amount"] = round(event["amount"], 2)
+        # Top 10 by amount (descending); nlargest keeps sort's tie order
+        top_10 = heapq.nlargest(10, all_events, key=itemgetter(0))
         
-        return top_10
+        return [
+            {
+                "timestamp": timestamp,
+                "side": side,
+                "amount": round(amount, 2),
+                "exchange": "Aggregated"
+            }
+            for amount, timestamp, side in top_10
+        ]
         
     except Exception:
         return None
@@ -781,8 +1025,7 @@ def normalize_coinbase_premium(data: Dict[str, Any]) -> Optional[Dict[str, Optio
     """
     try:
         # Check success code
-        code = str(data.get("code", ""))
-        if code not in ("0", "00", "success"):
+        if not _is_ok(data):
             return None
         
         # Extract data list
@@ -820,10 +1063,89 @@ def normalize_coinbase_premium(data: Dict[str, Any]) -> Optional[Dict[str, Optio
     except Exception:
         return None
 
+# ============================================================================
+# LATEST / 7D-AGO LOOKUP (shared by weekly_16/weekly_11/weekly_04/weekly_12)
+# ============================================================================
+
+def _latest_and_prev_7d_idx(ts_list: List[int],
+                            assume_sorted: bool = False) -> Tuple[int, Optional[int]]:
+    """
+    Locate the latest row and the row 7 days before it in a timestamp list
+
+    Args:
+        ts_list: Row timestamps (ms)
+        assume_sorted: Caller already sorted ts_list ascending; skip the check
+
+    Returns:
+        (latest_idx, prev_idx):
+        - latest_idx: first index holding the max timestamp
+        - prev_idx: last index with timestamp <= latest - 7d, None if none
+
+    These endpoints document ASCENDING order. When the list really is
+    ascending (checked with a C-level sorted() pass, which is linear on
+    presorted input), both lookups are bisections instead of a keyed max()
+    plus a reverse Python scan. Out-of-order payloads fall back to the scans.
+    """
+    if assume_sorted or ts_list == sorted(ts_list):
+        latest_ts = ts_list[-1]
+        latest_idx = bisect_left(ts_list, latest_ts)
+        prev_idx = bisect_right(ts_list, latest_ts - _SEVEN_DAYS_MS) - 1
+        return latest_idx, (prev_idx if prev_idx >= 0 else None)
+
+    latest_idx = ts_list.index(max(ts_list))
+    target_ts = ts_list[latest_idx] - _SEVEN_DAYS_MS
+    for i in range(len(ts_list) - 1, -1, -1):
+        if ts_list[i] <= target_ts:
+            return latest_idx, i
+    return latest_idx, None
+
+
+def _latest_and_7d_values(data: Dict[str, Any], ts_key: str,
+                          value_key: str) -> Optional[Tuple[float, Optional[float]]]:
+    """
+    Shared extraction for {"data": [{ts_key: ms, value_key: x}, ...]} histories
+
+    Args:
+        data: Raw API response
+        ts_key: Timestamp field ("time" or "timestamp"), missing counts as 0
+        value_key: Value field to read from the latest and 7d-ago rows
+
+    Returns:
+        (current, prev_7d) as floats; prev_7d is None if no row is old enough
+        or its value is missing. None if the code/list is bad or the latest
+        value is missing. Unparseable values raise (callers wrap in try).
+    """
+    if not _is_ok(data):
+        return None
+
+    data_list = data.get("data", [])
+    if not data_list:
+        return None
+
+    ts_list = [row.get(ts_key, 0) for row in data_list]
+    latest_idx, prev_idx = _latest_and_prev_7d_idx(ts_list)
+
+    current_value = data_list[latest_idx].get(value_key)
+    if current_value is None:
+        return None
+
+    prev_value = None
+    if prev_idx is not None:
+        prev_value = data_list[prev_idx].get(value_key)
+
+    return float(current_value), (float(prev_value) if prev_value is not None else None)
+
+
 # ============================================================================
 # NORMALIZER 11: Fear & Greed Index (weekly_16)
 # ============================================================================
 
+# Inclusive upper bound of each label band (the last band is open-ended):
+# <=24 Extreme Fear, <=44 Fear, <=55 Neutral, <=75 Greed, else Extreme Greed
+_FG_UPPER_BOUNDS = (24, 44, 55, 75)
+_FG_LABELS = ("Extreme Fear", "Fear", "Neutral", "Greed", "Extreme Greed")
+
+
 def normalize_fear_greed_index(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Extract Fear & Greed Index with 7-day trend
@@ -850,12 +1172,9 @@ def normalize_fear_greed_index(data: Dict[str, Any]) -> Optional[Dict[str, Any]]
         {"value": 72, "label": "Greed", "change_7d": 5.0}
         None if error or missing data
     """
-    DAY_MS = 86400000  # milliseconds per day
-
     try:
         # Check success code
-        code = str(data.get("code", ""))
-        if code not in ("0", "00", "success"):
+        if not _is_ok(data):
             return None
 
         # Extract inner data object
@@ -870,41 +1189,22 @@ def normalize_fear_greed_index(data: Dict[str, Any]) -> Optional[Dict[str, Any]]
         if not data_list or not time_list or len(data_list) != len(time_list):
             return None
 
-        # Find latest value by max timestamp
-        latest_idx = max(range(len(time_list)), key=lambda i: time_list[i])
-        latest_ts = time_list[latest_idx]
+        # Latest value (max timestamp) and 7d-ago index (timestamp <= latest - 7d)
+        latest_idx, prev_idx = _latest_and_prev_7d_idx(time_list)
         current_value = float(data_list[latest_idx])
 
         # Validate range (0-100)
         if current_value < 0 or current_value > 100:
             return None
 
-        # Calculate 7d change: find timestamp <= (latest - 7 days)
+        # Calculate 7d change
         change_7d = None
-        target_ts = latest_ts - (7 * DAY_MS)
-
-        # Reverse scan to find prev value (timestamp <= target)
-        prev_idx = None
-        for i in range(len(time_list) - 1, -1, -1):
-            if time_list[i] <= target_ts:
-                prev_idx = i
-                break
-
         if prev_idx is not None:
             prev_value = float(data_list[prev_idx])
             change_7d = round(current_value - prev_value, 1)
 
         # Assign label based on standard Fear & Greed ranges
-        if current_value <= 24:
-            label = "Extreme Fear"
-        elif current_value <= 44:
-            label = "Fear"
-        elif current_value <= 55:
-            label = "Neutral"
-        elif current_value <= 75:
-            label = "Greed"
-        else:
-            label = "Extreme Greed"
+        label = _FG_LABELS[bisect_left(_FG_UPPER_BOUNDS, current_value)]
 
         return {
             "value": int(current_value),
@@ -946,51 +1246,22 @@ def normalize_btc_dominance_change(data: Dict[str, Any]) -> Optional[Dict[str, A
         {"value": 57.23, "change_7d": 0.34}
         None if error or missing data
     """
-    DAY_MS = 86400000  # milliseconds per day
-
     try:
-        # Check success code
-        code = str(data.get("code", ""))
-        if code not in ("0", "00", "success"):
-            return None
-
-        # Extract data list
-        data_list = data.get("data", [])
-        if not data_list or len(data_list) < 1:
-            return None
-
-        # Find latest value by max timestamp
+        # Latest and 7d-ago values
         # NOTE: This endpoint uses "timestamp" key, not "time"
-        latest_idx = max(range(len(data_list)), key=lambda i: data_list[i].get("timestamp", 0))
-        latest = data_list[latest_idx]
-        latest_ts = latest.get("timestamp", 0)
-
-        current_value = latest.get("bitcoin_dominance")
-        if current_value is None:
+        values = _latest_and_7d_values(data, "timestamp", "bitcoin_dominance")
+        if values is None:
             return None
-
-        current_value = float(current_value)
+        current_value, prev_value = values
 
         # Validate range (0-100%)
         if current_value < 0 or current_value > 100:
             return None
 
-        # Calculate 7d change: find timestamp <= (latest - 7 days)
+        # Calculate 7d change
         change_7d = None
-        target_ts = latest_ts - (7 * DAY_MS)
-
-        # Reverse scan to find prev value (timestamp <= target)
-        prev_idx = None
-        for i in range(len(data_list) - 1, -1, -1):
-            row_ts = data_list[i].get("timestamp", 0)
-            if row_ts <= target_ts:
-                prev_idx = i
-                break
-
-        if prev_idx is not None:
-            prev_value = data_list[prev_idx].get("bitcoin_dominance")
-            if prev_value is not None:
-                change_7d = round(current_value - float(prev_value), 2)
+        if prev_value is not None:
+            change_7d = round(current_value - prev_value, 2)
 
         return {
             "value": round(current_value, 2),
@@ -1031,47 +1302,17 @@ def normalize_basis_spread(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         {"value": 0.20, "change_7d": 0.05}
         None if error or missing data
     """
-    DAY_MS = 86400000  # milliseconds per day
-
     try:
-        # Check success code
-        code = str(data.get("code", ""))
-        if code not in ("0", "00", "success"):
-            return None
-
-        # Extract data list
-        data_list = data.get("data", [])
-        if not data_list or len(data_list) < 1:
+        # Latest and 7d-ago close_basis values
+        values = _latest_and_7d_values(data, "time", "close_basis")
+        if values is None:
             return None
+        current_value, prev_value = values
 
-        # Find latest value by max timestamp
-        latest_idx = max(range(len(data_list)), key=lambda i: data_list[i].get("time", 0))
-        latest = data_list[latest_idx]
-        latest_ts = latest.get("time", 0)
-
-        # Get close_basis as the value
-        current_value = latest.get("close_basis")
-        if current_value is None:
-            return None
-
-        current_value = float(current_value)
-
-        # Calculate 7d change: find timestamp <= (latest - 7 days)
+        # Calculate 7d change
         change_7d = None
-        target_ts = latest_ts - (7 * DAY_MS)
-
-        # Reverse scan to find prev value (timestamp <= target)
-        prev_idx = None
-        for i in range(len(data_list) - 1, -1, -1):
-            row_ts = data_list[i].get("time", 0)
-            if row_ts <= target_ts:
-                prev_idx = i
-                break
-
-        if prev_idx is not None:
-            prev_value = data_list[prev_idx].get("close_basis")
-            if prev_value is not None:
-                change_7d = round(current_value - float(prev_value), 4)
+        if prev_value is not None:
+            change_7d = round(current_value - prev_value, 4)
 
         return {
             "value": round(current_value, 4),
@@ -1112,41 +1353,43 @@ def normalize_eth_btc_ratio(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         {"value": 0.03460394, "change_7d": 0.00069509}
         None if error or missing data
     """
-    DAY_MS = 86400000  # milliseconds per day
-
     def extract_latest_and_prev_7d(raw_response: Dict[str, Any]):
         """Extract latest and 7d-ago close values from spot price history"""
-        code = str(raw_response.get("code", ""))
-        if code not in ("0", "00", "success"):
+        if not _is_ok(raw_response):
             return None, None
 
         data_list = raw_response.get("data", [])
         if not data_list:
             return None, None
 
-        # Build (time, close) pairs
-        pairs = []
+        # Build parallel time/close lists (no per-row tuple)
+        ts_list = []
+        val_list = []
         for row in data_list:
             ts = row.get("time")
             close = row.get("close")
             if ts is None or close is None:
                 continue
-            pairs.append((int(ts), float(close)))
+            close_value = _to_float(close)
+            if close_value is None:
+                return None, None
+            ts_list.append(int(ts))
+            val_list.append(close_value)
 
-        if not pairs:
+        if not ts_list:
             return None, None
 
-        # Find latest by max timestamp
-        latest_ts, latest_val = max(pairs, key=lambda x: x[0])
-        target_ts = latest_ts - (7 * DAY_MS)
+        # ASC per contract; otherwise reorder both lists (stable, by time)
+        if ts_list != sorted(ts_list):
+            order = sorted(range(len(ts_list)), key=ts_list.__getitem__)
+            ts_list = [ts_list[i] for i in order]
+            val_list = [val_list[i] for i in order]
 
-        # Reverse scan for 7d-ago value
-        pairs_sorted = sorted(pairs, key=lambda x: x[0])
-        prev_val = None
-        for ts, val in reversed(pairs_sorted):
-            if ts <= target_ts:
-                prev_val = val
-                break
+        # Bisect for the latest bar and the last bar at or before latest - 7d
+        latest_idx, prev_idx = _latest_and_prev_7d_idx(ts_list, assume_sorted=True)
+
+        latest_val = val_list[latest_idx]
+        prev_val = val_list[prev_idx] if prev_idx is not None else None
 
         return latest_val, prev_val
 
@@ -1215,16 +1458,11 @@ def normalize_funding_rate_avg_7d(data: Dict[str, Any]) -> Optional[Dict[str, An
         None if error or insufficient data (< 14 bars)
     """
     try:
-        # Check success code
-        code = str(data.get("code", ""))
-        if code not in ("0", "00", "success"):
+        # Check success code, extract data list (14 days: current + previous week)
+        data_list = _ok_data_list(data, 14)
+        if data_list is None:
             return None
 
-        # Extract data list
-        data_list = data.get("data", [])
-        if not data_list or len(data_list) < 14:
-            return None  # Need 14 days for current + previous week
-
         # Build (time, close) pairs
         pairs = []
         for row in data_list:
@@ -1232,25 +1470,19 @@ def normalize_funding_rate_avg_7d(data: Dict[str, Any]) -> Optional[Dict[str, An
             close = row.get("close")
             if ts is None or close is None:
                 continue
-            pairs.append((int(ts), float(close)))
+            close_value = _to_float(close)
+            if close_value is None:
+                return None
+            pairs.append((int(ts), close_value))
 
         if len(pairs) < 14:
             return None
 
-        # Sort by timestamp (ascending)
-        pairs_sorted = sorted(pairs, key=lambda x: x[0])
-
-        # Take last 14 days
-        last_14 = pairs_sorted[-14:]
-
-        # Current week: last 7 bars (most recent)
-        current_week = last_14[-7:]
-        # Previous week: first 7 bars of last_14
-        prev_week = last_14[:7]
+        # Sort ascending, take last 14 days, split prev7 | curr7
+        last_14 = _sorted_last_14(pairs)
 
         # Calculate averages
-        current_avg = sum(val for _, val in current_week) / len(current_week)
-        prev_avg = sum(val for _, val in prev_week) / len(prev_week)
+        prev_avg, current_avg = _week_means([val for _, val in last_14])
 
         # Change is current - previous
         change_7d = current_avg - prev_avg
@@ -1268,6 +1500,7 @@ def normalize_funding_rate_avg_7d(data: Dict[str, Any]) -> Optional[Dict[str, An
 # NORMALIZER 16/17: Liquidations 7d Base (weekly_06/weekly_07)
 # ============================================================================
 
+@_memoize_last_payload
 def _normalize_liquidations_7d_base(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Base normalizer for 7-day liquidation totals (long and short)
@@ -1301,48 +1534,28 @@ def _normalize_liquidations_7d_base(data: Dict[str, Any]) -> Optional[Dict[str,
         None if error or insufficient data
     """
     try:
-        # Check success code
-        code = str(data.get("code", ""))
-        if code not in ("0", "00", "success"):
-            return None
-
-        # Extract data list
-        data_list = data.get("data", [])
-        if not data_list or len(data_list) < 14:
+        # Check success code, extract data list (14 days: current + previous week)
+        data_list = _ok_data_list(data, 14)
+        if data_list is None:
             return None
 
         # Build valid (time, long, short) tuples
         rows = []
         for row in data_list:
-            ts = row.get("time")
-            long_val = row.get("aggregated_long_liquidation_usd")
-            short_val = row.get("aggregated_short_liquidation_usd")
-            if ts is None or long_val is None or short_val is None:
-                continue
             try:
+                ts, long_val, short_val = _get_time_long_short(row)
                 rows.append((int(ts), float(long_val), float(short_val)))
-            except (ValueError, TypeError):
+            except _ROW_SKIP_ERRORS:
                 continue
 
         if len(rows) < 14:
             return None
 
-        # Sort by timestamp ascending
-        rows_sorted = sorted(rows, key=lambda x: x[0])
-
-        # Take last 14 days
-        last_14 = rows_sorted[-14:]
-
-        # Current week: last 7 bars (most recent)
-        current_week = last_14[-7:]
-        # Previous week: first 7 bars of last_14
-        prev_week = last_14[:7]
-
-        # Calculate sums
-        long_curr = sum(r[1] for r in current_week)
-        long_prev = sum(r[1] for r in prev_week)
-        short_curr = sum(r[2] for r in current_week)
-        short_prev = sum(r[2] for r in prev_week)
+        # Sort ascending, take last 14 days, split prev7 | curr7
+        # zip(*) transposes the window into long/short columns in one pass
+        _, longs, shorts = zip(*_sorted_last_14(rows))
+        long_prev, long_curr = _week_sums(longs)
+        short_prev, short_curr = _week_sums(shorts)
 
         return {
             "long_7d": long_curr,
@@ -1370,10 +1583,7 @@ def normalize_long_liquidations_7d(data: Dict[str, Any]) -> Optional[Dict[str, A
         return None
 
     # Convert to millions for readability
-    return {
-        "value": round(base["long_7d"] / 1e6, 2),
-        "change_7d": round(base["long_change_7d"] / 1e6, 2)
-    }
+    return _weekly_output(base["long_7d"] / 1e6, base["long_change_7d"] / 1e6)
 
 
 def normalize_short_liquidations_7d(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -1391,10 +1601,7 @@ def normalize_short_liquidations_7d(data: Dict[str, Any]) -> Optional[Dict[str,
         return None
 
     # Convert to millions for readability
-    return {
-        "value": round(base["short_7d"] / 1e6, 2),
-        "change_7d": round(base["short_change_7d"] / 1e6, 2)
-    }
+    return _weekly_output(base["short_7d"] / 1e6, base["short_change_7d"] / 1e6)
 
 
 # ============================================================================
@@ -1434,38 +1641,27 @@ def normalize_oi_trend_7d(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         None if error or insufficient data
     """
     try:
-        # Check success code
-        code = str(data.get("code", ""))
-        if code not in ("0", "00", "success"):
-            return None
-
-        # Extract data list
-        data_list = data.get("data", [])
-        if not data_list or len(data_list) < 14:
+        # Check success code, extract data list (14 days: current + previous week)
+        data_list = _ok_data_list(data, 14)
+        if data_list is None:
             return None
 
         # Build valid (time, close) pairs
         pairs = []
         for row in data_list:
-            ts = row.get("time")
-            close = row.get("close")
-            if ts is None or close is None:
-                continue
             try:
-                close_val = float(close)
-                if close_val > 0:
-                    pairs.append((int(ts), close_val))
-            except (ValueError, TypeError):
+                ts, close_val = _get_time_close(row)
+                ts, close_val = int(ts), float(close_val)
+            except _ROW_SKIP_ERRORS:
                 continue
+            if close_val > 0:
+                pairs.append((ts, close_val))
 
         if len(pairs) < 14:
             return None
 
-        # Sort by timestamp ascending
-        pairs_sorted = sorted(pairs, key=lambda x: x[0])
-
-        # Take last 14 days
-        last_14 = pairs_sorted[-14:]
+        # Sort ascending and take last 14 days
+        last_14 = _sorted_last_14(pairs)
 
         # prev7 = first 7 (older), curr7 = last 7 (newer)
         prev7 = last_14[:7]
@@ -1492,6 +1688,7 @@ def normalize_oi_trend_7d(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
 # NORMALIZER 19/20: Taker Volume 7d Base (weekly_13/weekly_14)
 # ============================================================================
 
+@_memoize_last_payload
 def _normalize_taker_volume_7d_base(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Base normalizer for 7-day taker buy/sell volume (proxy for perp volume)
@@ -1525,46 +1722,26 @@ def _normalize_taker_volume_7d_base(data: Dict[str, Any]) -> Optional[Dict[str,
         None if error or insufficient data
     """
     try:
-        # Check success code
-        code = str(data.get("code", ""))
-        if code not in ("0", "00", "success"):
-            return None
-
-        # Extract data list
-        data_list = data.get("data", [])
-        if not data_list or len(data_list) < 14:
+        # Check success code, extract data list (14 days: current + previous week)
+        data_list = _ok_data_list(data, 14)
+        if data_list is None:
             return None
 
-        # Build valid (time, buy, sell) tuples
+        # Build valid (time, buy + sell) pairs - total volume is all we sum
         rows = []
         for row in data_list:
-            ts = row.get("time")
-            buy_val = row.get("aggregated_buy_volume_usd")
-            sell_val = row.get("aggregated_sell_volume_usd")
-            if ts is None or buy_val is None or sell_val is None:
-                continue
             try:
-                rows.append((int(ts), float(buy_val), float(sell_val)))
-            except (ValueError, TypeError):
+                ts, buy_val, sell_val = _get_time_buy_sell(row)
+                rows.append((int(ts), float(buy_val) + float(sell_val)))
+            except _ROW_SKIP_ERRORS:
                 continue
 
         if len(rows) < 14:
             return None
 
-        # Sort by timestamp ascending
-        rows_sorted = sorted(rows, key=lambda x: x[0])
-
-        # Take last 14 days
-        last_14 = rows_sorted[-14:]
-
-        # Current week: last 7 bars (most recent)
-        current_week = last_14[-7:]
-        # Previous week: first 7 bars of last_14
-        prev_week = last_14[:7]
-
-        # Calculate sums (buy + sell = total volume)
-        curr7_total = sum(r[1] + r[2] for r in current_week)
-        prev7_total = sum(r[1] + r[2] for r in prev_week)
+        # Sort ascending, take last 14 days, split prev7 | curr7
+        _, totals = zip(*_sorted_last_14(rows))
+        prev7_total, curr7_total = _week_sums(totals)
 
         # Convert to billions
         curr7_total_bil = curr7_total / 1e9
@@ -1601,10 +1778,7 @@ def normalize_major_exchange_volume_7d(data: Dict[str, Any]) -> Optional[Dict[st
     if base is None:
         return None
 
-    return {
-        "value": round(base["curr7_total_bil"], 2),
-        "change_7d": round(base["change_bil"], 2)
-    }
+    return _weekly_output(base["curr7_total_bil"], base["change_bil"])
 
 
 def normalize_perp_volume_change_7d(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -1624,10 +1798,7 @@ def normalize_perp_volume_change_7d(data: Dict[str, Any]) -> Optional[Dict[str,
     # Lupo spec: change_7d is PERCENT for weekly_14
     pct_change = base["pct"] if base["pct"] is not None else 0.0
 
-    return {
-        "value": round(base["curr7_total_bil"], 2),
-        "change_7d": round(pct_change, 2)
-    }
+    return _weekly_output(base["curr7_total_bil"], pct_change)
 
 
 # ============================================================================
@@ -1659,44 +1830,31 @@ def normalize_usdt_premium_7d(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         None if error or insufficient data
     """
     try:
-        # Check success code
-        code = str(data.get("code", ""))
-        if code not in ("0", "00", "success"):
-            return None
-
-        # Extract data list
-        data_list = data.get("data", [])
-        if not data_list or len(data_list) < 14:
+        # Check success code, extract data list (14 days: current + previous week)
+        data_list = _ok_data_list(data, 14)
+        if data_list is None:
             return None
 
         # Build valid (time, close) pairs
         rows = []
         for row in data_list:
-            ts = row.get("time")
-            close = row.get("close")
-            if ts is None or close is None:
-                continue
             try:
-                rows.append((int(ts), float(close)))
-            except (ValueError, TypeError):
+                ts, close_val = _get_time_close(row)
+                rows.append((int(ts), float(close_val)))
+            except _ROW_SKIP_ERRORS:
                 continue
 
         if len(rows) < 14:
             return None
 
-        # Sort by timestamp ascending
-        rows_sorted = sorted(rows, key=lambda x: x[0])
-
-        # Take last 14 days
-        last_14 = rows_sorted[-14:]
-
-        # Calculate premium for each day: (close - 1.0) * 100
-        premiums = [(close - 1.0) * 100 for _, close in last_14]
+        # Sort ascending and take last 14 days
+        last_14 = _sorted_last_14(rows)
 
+        # Premium (close - 1.0) * 100, only needed at the two week ends:
         # prev7_last = index 6 (7th day, end of prev week)
         # curr7_last = index 13 (last day, end of current week)
-        prev7_last = premiums[6]
-        curr7_last = premiums[-1]
+        prev7_last = (last_14[6][1] - 1.0) * 100
+        curr7_last = (last_14[-1][1] - 1.0) * 100
 
         value = round(curr7_last, 2)
         change_7d = round(curr7_last - prev7_last, 2)
@@ -1751,36 +1909,35 @@ def normalize_active_addresses_7d(data: Dict[str, Any]) -> Optional[Dict[str, An
         if not isinstance(data_list, list) or len(data_list) < 14:
             return None
 
-        # Build (timestamp, active_address_count) tuples
-        entries = []
-        for item in data_list:
-            if not isinstance(item, dict):
-                continue
-            ts = item.get("timestamp")
-            count = item.get("active_address_count")
-            if ts is None or count is None:
-                continue
-            try:
-                ts_val = int(ts)
-                count_val = float(count)
-                entries.append((ts_val, count_val))
-            except (ValueError, TypeError):
-                continue
+        # Parse timestamps for every row; counts only where needed
+        stamped = [
+            (ts_val, item)
+            for item in data_list
+            if isinstance(item, dict)
+            and (ts_val := _to_int(item.get("timestamp"))) is not None
+        ]
 
-        if len(entries) < 14:
+        if len(stamped) < 14:
             return None
 
-        # Sort by timestamp ASC and take last 14
-        entries.sort(key=lambda x: x[0])
-        last14 = entries[-14:]
+        # Newest 14 rows (ASC); parse their counts only
+        last14 = _sorted_last_14_of_many(stamped)
+        counts = [_to_float(item.get("active_address_count")) for _, item in last14]
 
-        # Split into prev7 and curr7
-        prev7 = last14[:7]
-        curr7 = last14[7:]
+        if None in counts:
+            # Rare: a bad count inside the window - drop unparseable rows
+            # from the full history and select again
+            entries = []
+            for ts_val, item in stamped:
+                count_val = _to_float(item.get("active_address_count"))
+                if count_val is not None:
+                    entries.append((ts_val, count_val))
+            if len(entries) < 14:
+                return None
+            counts = [e[1] for e in _sorted_last_14_of_many(entries)]
 
-        # Calculate averages
-        prev7_avg = sum(e[1] for e in prev7) / len(prev7)
-        curr7_avg = sum(e[1] for e in curr7) / len(curr7)
+        # Split prev7 | curr7 and average each week
+        prev7_avg, curr7_avg = _week_means(counts)
 
         # Convert to thousands (k) with 2 decimals
         value_k = round(curr7_avg / 1000, 2)
@@ -1799,8 +1956,21 @@ def normalize_active_addresses_7d(data: Dict[str, Any]) -> Optional[Dict[str, An
 # NORMALIZER: Stablecoin Market Cap (monthly_09)
 # ============================================================================
 
-# Known stablecoins to aggregate
-_KNOWN_STABLECOINS = {"USDT", "USDC", "DAI", "BUSD", "TUSD", "FDUSD", "USDE", "FRAX", "USDP", "GUSD"}
+# Known stablecoin tickers (reference list - the total sums every coin reported)
+_KNOWN_STABLECOINS = frozenset({"USDT", "USDC", "DAI", "BUSD", "TUSD", "FDUSD", "USDE", "FRAX", "USDP", "GUSD"})
+
+
+def _sum_coin_values(entry: Dict[str, Any]) -> float:
+    """
+    Sum every coin's market cap in one data_list entry
+
+    Unparseable values are skipped rather than failing the whole entry.
+    """
+    return sum(
+        [value for value in map(_to_float, entry.values()) if value is not None],
+        0.0
+    )
+
 
 def normalize_stablecoin_market_cap(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
@@ -1853,12 +2023,7 @@ def normalize_stablecoin_market_cap(data: Dict[str, Any]) -> Optional[Dict[str,
             return None
 
         # Sum all stablecoins (known + unknown) for total market cap
-        total_latest = 0.0
-        for coin, value in latest_entry.items():
-            try:
-                total_latest += float(value)
-            except (ValueError, TypeError):
-                continue
+        total_latest = _sum_coin_values(latest_entry)
 
         if total_latest <= 0:
             return None
@@ -1869,12 +2034,7 @@ def normalize_stablecoin_market_cap(data: Dict[str, Any]) -> Optional[Dict[str,
             idx_30d_ago = latest_idx - 30
             entry_30d_ago = data_list[idx_30d_ago]
             if isinstance(entry_30d_ago, dict):
-                total_30d_ago = 0.0
-                for coin, value in entry_30d_ago.items():
-                    try:
-                        total_30d_ago += float(value)
-                    except (ValueError, TypeError):
-                        continue
+                total_30d_ago = _sum_coin_values(entry_30d_ago)
                 if total_30d_ago > 0:
                     change_30d = total_latest - total_30d_ago
 
@@ -1883,13 +2043,11 @@ def normalize_stablecoin_market_cap(data: Dict[str, Any]) -> Optional[Dict[str,
         change_30d_b = round(change_30d / 1e9, 2)
 
         # Get timestamp (convert ms to seconds)
-        latest_ts_ms = time_list[latest_idx]
-        ts_sec = int(latest_ts_ms) // 1000 if latest_ts_ms > 1e12 else int(latest_ts_ms)
+        latest_ts = int(time_list[latest_idx])
+        ts_sec = _to_seconds(latest_ts)
 
         # Convert to ISO date
-        from datetime import datetime, timezone
-        dt = datetime.fromtimestamp(ts_sec, tz=timezone.utc)
-        ts_date = dt.strftime("%Y-%m-%d")
+        ts_date = _utc_iso_date(ts_sec)
 
         return {
             "value_b": value_b,
@@ -1949,10 +2107,9 @@ def normalize_futures_oi_growth_30d(data: Dict[str, Any]) -> Optional[Dict[str,
 
         # timestamps are ms in this endpoint
         ts_ms = int(last.get("time"))
-        ts_sec = ts_ms // 1000 if ts_ms > 10**12 else ts_ms
+        ts_sec = _to_seconds(ts_ms)
 
-        from datetime import datetime, timezone
-        ts_date = datetime.fromtimestamp(ts_sec, tz=timezone.utc).strftime("%Y-%m-%d")
+        ts_date = _utc_iso_date(ts_sec)
 
         return {
             "value_b": round(last_close / 1e9, 2),
@@ -1986,9 +2143,6 @@ def normalize_volatility_30d(data):
         or None
     """
     try:
-        import math, statistics
-        from datetime import datetime, timezone
-
         if not isinstance(data, dict):
             return None
 
@@ -1998,7 +2152,6 @@ def normalize_volatility_30d(data):
 
         window = inner[-31:]  # last 31 closes -> 30 returns
         closes = []
-        times = []
         for c in window:
             if not isinstance(c, dict):
                 return None
@@ -2006,22 +2159,24 @@ def normalize_volatility_30d(data):
             t = c.get("time")
             if close is None or t is None:
                 return None
-            closes.append(float(close))
-            ts = int(t)
-            ts = ts // 1000 if ts > 10**12 else ts
-            times.append(ts)
+            close_value = _to_float(close)
+            if close_value is None:
+                return None
+            closes.append(close_value)
+            ts = int(t)  # validated per row; only the latest is reported
 
         if len(closes) < 31 or closes[0] == 0:
             return None
 
-        rets = [math.log(closes[i] / closes[i-1]) for i in range(1, len(closes))]
-        stdev = statistics.pstdev(rets)
+        # log(c[i] / c[i-1]) for each consecutive pair, iterated in C
+        rets = list(map(math.log, map(truediv, closes[1:], closes)))
+        stdev = pstdev(rets)
         annual = stdev * math.sqrt(365)
 
         price_change_30d_pct = ((closes[-1] - closes[0]) / closes[0]) * 100.0
 
-        ts_sec = times[-1]
-        ts_date = datetime.fromtimestamp(ts_sec, tz=timezone.utc).strftime("%Y-%m-%d")
+        ts_sec = _to_seconds(ts)
+        ts_date = _utc_iso_date(ts_sec)
 
         return {
             "daily_vol_pct": round(stdev * 100, 4),
@@ -2035,6 +2190,106 @@ def normalize_volatility_30d(data):
         return None
 
 
+# ============================================================================
+# ETF HOLDINGS AGGREGATION (shared by monthly_12/monthly_13)
+# ============================================================================
+
+def _is_spot_us_etf(item: Dict[str, Any]) -> bool:
+    """Filter for monthly_12: Spot US ETFs only (STRICT)"""
+    return item.get("fund_type", "") == "Spot" and item.get("region", "") == "us"
+
+
+def _is_grayscale_us_fund(item: Dict[str, Any]) -> bool:
+    """Filter for monthly_13: region=="us" AND name contains "grayscale" """
+    if item.get("region", "") != "us":
+        return False
+    fund_name = item.get("fund_name", "") or item.get("name", "")
+    return "grayscale" in fund_name.lower()
+
+
+def _aggregate_us_etf_holdings(data: Dict[str, Any],
+                               include: Callable[[Dict[str, Any]], bool]) -> Optional[Dict[str, Any]]:
+    """
+    Sum holding_quantity over /api/etf/bitcoin/list items accepted by include()
+
+    One pass per payload: filter, holding, max update_timestamp and max
+    update_date are taken from each item as it is visited.
+
+    Returns:
+        {"total_btc", "fund_count", "ts", "ts_date"} (see the two wrappers)
+        None if nothing matched. Malformed fields raise (wrappers catch).
+    """
+    if not isinstance(data, dict):
+        return None
+
+    # Handle wrapped response
+    inner = data.get("data", data)
+    if isinstance(inner, dict) and "data" in inner:
+        inner = inner.get("data")
+    if not isinstance(inner, list):
+        return None
+
+    total_btc = 0.0
+    fund_count = 0
+    max_ts = 0
+    max_date = ""
+
+    for item in inner:
+        if not isinstance(item, dict) or not include(item):
+            continue
+
+        asset_details = item.get("asset_details", {})
+        if not isinstance(asset_details, dict):
+            continue
+
+        holding = asset_details.get("holding_quantity")
+        if holding is None:
+            continue
+
+        holding_val = _to_float(holding)
+        if holding_val is None:
+            continue
+
+        total_btc += holding_val
+        fund_count += 1
+
+        # Track max timestamp
+        ts_ms = item.get("update_timestamp")
+        if ts_ms:
+            try:
+                ts_val = int(ts_ms)
+                if ts_val > max_ts:
+                    max_ts = ts_val
+            except (ValueError, TypeError):
+                pass
+
+        # Track max date
+        update_date = asset_details.get("update_date", "")
+        if update_date and update_date > max_date:
+            max_date = update_date
+
+    if fund_count == 0 or total_btc <= 0:
+        return None
+
+    # Convert ms to seconds
+    ts_sec = _to_seconds(max_ts)
+
+    # Derive ts_date
+    if max_date:
+        ts_date = max_date
+    elif ts_sec > 0:
+        ts_date = _utc_iso_date(ts_sec)
+    else:
+        ts_date = ""
+
+    return {
+        "total_btc": round(total_btc, 2),
+        "fund_count": fund_count,
+        "ts": ts_sec,
+        "ts_date": ts_date
+    }
+
+
 # ============================================================================
 # NORMALIZER: ETF Bitcoin Holdings Total (monthly_12)
 # ============================================================================
@@ -2071,87 +2326,7 @@ def normalize_etf_bitcoin_holdings_total(data: Dict[str, Any]) -> Optional[Dict[
         or None on error
     """
     try:
-        from datetime import datetime, timezone
-
-        if not isinstance(data, dict):
-            return None
-
-        # Handle wrapped response
-        inner = data.get("data", data)
-        if isinstance(inner, dict) and "data" in inner:
-            inner = inner.get("data")
-        if not isinstance(inner, list):
-            return None
-
-        total_btc = 0.0
-        fund_count = 0
-        max_ts = 0
-        max_date = ""
-
-        for item in inner:
-            if not isinstance(item, dict):
-                continue
-
-            fund_type = item.get("fund_type", "")
-            region = item.get("region", "")
-
-            # Filter: Spot US ETFs only (STRICT)
-            if fund_type != "Spot" or region != "us":
-                continue
-
-            asset_details = item.get("asset_details", {})
-            if not isinstance(asset_details, dict):
-                continue
-
-            holding = asset_details.get("holding_quantity")
-            if holding is None:
-                continue
-
-            try:
-                holding_val = float(holding)
-            except (ValueError, TypeError):
-                continue
-
-            total_btc += holding_val
-            fund_count += 1
-
-            # Track max timestamp
-            ts_ms = item.get("update_timestamp")
-            if ts_ms:
-                try:
-                    ts_val = int(ts_ms)
-                    if ts_val > max_ts:
-                        max_ts = ts_val
-                except (ValueError, TypeError):
-                    pass
-
-            # Track max date
-            update_date = asset_details.get("update_date", "")
-            if update_date and update_date > max_date:
-                max_date = update_date
-
-        if fund_count == 0 or total_btc <= 0:
-            return None
-
-        # Convert ms to seconds
-        ts_sec = max_ts // 1000 if max_ts > 1e12 else max_ts
-
-        # Derive ts_date
-        if max_date:
-            ts_date = max_date
-        elif ts_sec > 0:
-            dt = datetime.fromtimestamp(ts_sec, tz=timezone.utc)
-            ts_date = dt.strftime("%Y-%m-%d")
-        else:
-            ts_date = ""
-
-        return {
-            "total_btc": round(total_btc, 2),
-            "fund_count": fund_count,
-            "ts": ts_sec,
-            "ts_date": ts_date
-        }
-
+        return _aggregate_us_etf_holdings(data, _is_spot_us_etf)
     except Exception:
         return None
 
@@ -2179,89 +2354,7 @@ def normalize_grayscale_us_holdings_total(data: Dict[str, Any]) -> Optional[Dict
         or None on error
     """
     try:
-        from datetime import datetime, timezone
-
-        if not isinstance(data, dict):
-            return None
-
-        # Handle wrapped response
-        inner = data.get("data", data)
-        if isinstance(inner, dict) and "data" in inner:
-            inner = inner.get("data")
-        if not isinstance(inner, list):
-            return None
-
-        total_btc = 0.0
-        fund_count = 0
-        max_ts = 0
-        max_date = ""
-
-        for item in inner:
-            if not isinstance(item, dict):
-                continue
-
-            region = item.get("region", "")
-            fund_name = item.get("fund_name", "") or item.get("name", "")
-
-            # Filter: region=="us" AND name contains "grayscale"
-            if region != "us":
-                continue
-            if "grayscale" not in fund_name.lower():
-                continue
-
-            asset_details = item.get("asset_details", {})
-            if not isinstance(asset_details, dict):
-                continue
-
-            holding = asset_details.get("holding_quantity")
-            if holding is None:
-                continue
-
-            try:
-                holding_val = float(holding)
-            except (ValueError, TypeError):
-                continue
-
-            total_btc += holding_val
-            fund_count += 1
-
-            # Track max timestamp
-            ts_ms = item.get("update_timestamp")
-            if ts_ms:
-                try:
-                    ts_val = int(ts_ms)
-                    if ts_val > max_ts:
-                        max_ts = ts_val
-                except (ValueError, TypeError):
-                    pass
-
-            # Track max date
-            update_date = asset_details.get("update_date", "")
-            if update_date and update_date > max_date:
-                max_date = update_date
-
-        if fund_count == 0 or total_btc <= 0:
-            return None
-
-        # Convert ms to seconds
-        ts_sec = max_ts // 1000 if max_ts > 1e12 else max_ts
-
-        # Derive ts_date
-        if max_date:
-            ts_date = max_date
-        elif ts_sec > 0:
-            dt = datetime.fromtimestamp(ts_sec, tz=timezone.utc)
-            ts_date = dt.strftime("%Y-%m-%d")
-        else:
-            ts_date = ""
-
-        return {
-            "total_btc": round(total_btc, 2),
-            "fund_count": fund_count,
-            "ts": ts_sec,
-            "ts_date": ts_date
-        }
-
+        return _aggregate_us_etf_holdings(data, _is_grayscale_us_fund)
     except Exception:
         return None
 
@@ -2297,8 +2390,6 @@ def normalize_options_volume_growth_30d(data: Dict[str, Any]) -> Optional[Dict[s
       or None on error
     """
     try:
-        from datetime import datetime, timezone
-
         if not isinstance(data, dict):
             return None
 
@@ -2331,15 +2422,8 @@ def normalize_options_volume_growth_30d(data: Dict[str, Any]) -> Optional[Dict[s
         i0 = i1 - 60
         mid = i1 - 30  # split: [i0:mid] prev 30, [mid:i1] last 30
 
-        def day(ts_ms: int) -> str:
-            try:
-                dt = datetime.fromtimestamp(int(ts_ms)/1000, tz=timezone.utc)
-                return dt.strftime("%Y-%m-%d")
-            except Exception:
-                return ""
-
-        start_date = day(time_list[mid])     # first day of last-30 window
-        end_date   = day(time_list[i1-1])    # last day
+        start_date = _utc_iso_date_ms(time_list[mid])     # first day of last-30 window
+        end_date   = _utc_iso_date_ms(time_list[i1-1])    # last day
 
         last_total = 0.0
         prev_total = 0.0
@@ -2350,9 +2434,13 @@ def normalize_options_volume_growth_30d(data: Dict[str, Any]) -> Optional[Dict[s
             if len(series) != len(time_list):
                 continue
 
-            # Sum last 30 and previous 30
-            prev_total += sum(float(x or 0) for x in series[i0:mid])
-            last_total += sum(float(x or 0) for x in series[mid:i1])
+            # Coerce the 60-day window once, then sum previous 30 | last 30.
+            # None/"" count as 0.0; an unparseable value fails the metric.
+            window = [_to_float(x or 0) for x in series[i0:i1]]
+            if None in window:
+                return None
+            prev_total += sum(window[:30])
+            last_total += sum(window[30:])
 
         if last_total <= 0 or prev_total <= 0:
             return None
@@ -2373,21 +2461,48 @@ def normalize_options_volume_growth_30d(data: Dict[str, Any]) -> Optional[Dict[s
 
 
 
+def _unwrap_response(payload: Any) -> Any:
+    """
+    APIResponse-style wrapper -> its .data attribute; anything else unchanged
+
+    Exact dict/list payloads (what the orchestrator normally passes) skip
+    the attribute probe. A failing .data property leaves payload as is.
+    """
+    if type(payload) is dict or type(payload) is list:
+        return payload
+    try:
+        return getattr(payload, "data", payload)
+    except Exception:
+        return payload
+
+
 # Helper function for unwrapping CoinGlass API response
 def _unwrap_coinglass_data(payload):
     """
     Unwrap CoinGlass API response format.
     CoinGlass v4 returns {"code":"0","data":[...]} wrapper.
     """
-    if payload is None:
-        return None
+    # One probe: the default returns the payload itself when "data" is absent
     if isinstance(payload, dict):
-        if "data" in payload:
-            return payload.get("data")
-        return payload
+        return payload.get("data", payload)
     return payload
 
 
+# (output group, long field, short field) in the CFTC legacy report row
+_CFTC_POSITION_GROUPS = (
+    ("noncomm", "noncomm_positions_long_all", "noncomm_positions_short_all"),
+    ("comm", "comm_positions_long_all", "comm_positions_short_all"),
+    ("nonrept", "nonrept_positions_long_all", "nonrept_positions_short_all"),
+)
+
+
+def _cftc_float(x):
+    try:
+        return float(x)
+    except Exception:
+        return None
+
+
 def normalize_cme_cftc_long_short(rows):
     # Accept both raw dict (external fetch contract) and list[dict]
     if isinstance(rows, dict):
@@ -2404,31 +2519,16 @@ def normalize_cme_cftc_long_short(rows):
 
     row = rows[0]
 
-    def fnum(x):
-        try:
-            return float(x)
-        except Exception:
-            return None
-
-    ncl = fnum(row.get("noncomm_positions_long_all"))
-    ncs = fnum(row.get("noncomm_positions_short_all"))
-    cml = fnum(row.get("comm_positions_long_all"))
-    cms = fnum(row.get("comm_positions_short_all"))
-    nrl = fnum(row.get("nonrept_positions_long_all"))
-    nrs = fnum(row.get("nonrept_positions_short_all"))
-
-    def ratio(L, S):
-        if L is None or S is None or S == 0:
-            return None
-        return round(L / S, 4)
-
-    return {
+    out = {
         "report_date": row.get("report_date_as_yyyy_mm_dd"),
-        "open_interest_all": fnum(row.get("open_interest_all")),
-        "noncomm": {"long": ncl, "short": ncs, "ratio": ratio(ncl, ncs)},
-        "comm":    {"long": cml, "short": cms, "ratio": ratio(cml, cms)},
-        "nonrept": {"long": nrl, "short": nrs, "ratio": ratio(nrl, nrs)},
+        "open_interest_all": _cftc_float(row.get("open_interest_all")),
     }
+    for group, long_key, short_key in _CFTC_POSITION_GROUPS:
+        L = _cftc_float(row.get(long_key))
+        S = _cftc_float(row.get(short_key))
+        ratio = None if (L is None or S is None or S == 0) else round(L / S, 4)
+        out[group] = {"long": L, "short": S, "ratio": ratio}
+    return out
 
 def normalize_cme_cftc_open_interest(rows):
     # Accept both raw dict (external fetch contract) and list[dict]
@@ -2457,11 +2557,19 @@ def normalize_cme_cftc_open_interest(rows):
 # FUNDING REGIME (Derived) - uses funding history series (8h)
 # Adds: normalize_funding_regime + helper summary
 # ------------------------------------------------------------
-import statistics
-from typing import Any, Dict, List, Optional
+
+def _clamp01(x: float) -> float:
+    """
+    Clamp a score component to [0.0, 1.0] without the max()/min() calls
+
+    Same results as max(0.0, min(1.0, x)), including NaN -> 1.0.
+    """
+    if 0.0 <= x <= 1.0:
+        return x
+    return 0.0 if x < 0.0 else 1.0
+
 
 def _funding_regime_summary(series, interval_hours=8):
-    import math
     try:
         if not isinstance(series, list) or len(series) < 3:
             return None
@@ -2481,40 +2589,45 @@ def _funding_regime_summary(series, interval_hours=8):
             return None
 
         last = vals[-1]
-        mean = sum(vals) / n
+        mean = fmean(vals)  # fsum-based: stable when rates cancel around zero
         sorted_vals = sorted(vals)
         median = sorted_vals[n // 2] if (n % 2 == 1) else (sorted_vals[n // 2 - 1] + sorted_vals[n // 2]) / 2.0
         vmin = min(vals)
         vmax = max(vals)
 
-        var = sum((x - mean) ** 2 for x in vals) / (n - 1)
+        var = sum([(x - mean) ** 2 for x in vals]) / (n - 1)
         stdev = math.sqrt(var) if var >= 0 else 0.0
 
-        flips = 0
-        for i in range(1, n):
-            if (vals[i - 1] >= 0 and vals[i] < 0) or (vals[i - 1] < 0 and vals[i] >= 0):
-                flips += 1
+        # Sign flips between consecutive bars (pairwise, no index arithmetic)
+        flips = sum(
+            1 for a, b in zip(vals, vals[1:])
+            if (a >= 0 and b < 0) or (a < 0 and b >= 0)
+        )
 
         pos_ratio = sum(1 for x in vals if x > 0) / n
 
-        xs = list(range(n))
-        x_mean = sum(xs) / n
-        denom = sum((x - x_mean) ** 2 for x in xs)
+        # OLS slope against bar index 0..n-1. x_mean is a multiple of 0.5,
+        # so the closed-form sum of squared deviations is exact in float.
+        x_mean = (n - 1) / 2
+        denom = n * (n * n - 1) / 12
         slope = 0.0
         if denom != 0:
-            slope = sum((xs[i] - x_mean) * (vals[i] - mean) for i in range(n)) / denom
+            slope = sum([(i - x_mean) * (v - mean) for i, v in enumerate(vals)]) / denom
 
         z_last = 0.0
         if stdev and stdev > 0:
             z_last = (last - mean) / stdev
 
-        dec = [x / 100.0 for x in vals]
-        cum_dec = sum(dec)
-        cum_pct = cum_dec * 100.0
+        cum_pct = sum([x / 100.0 for x in vals]) * 100.0
 
         periods_per_year = int((24 / interval_hours) * 365)
         mean_dec = (mean / 100.0)
-        ann_carry = (1.0 + mean_dec) ** periods_per_year - 1.0
+        if mean_dec > -1.0:
+            # (1 + r) ** p - 1 via log1p/expm1: no precision loss from
+            # forming 1 + r when r is a tiny funding rate
+            ann_carry = math.expm1(periods_per_year * math.log1p(mean_dec))
+        else:
+            ann_carry = (1.0 + mean_dec) ** periods_per_year - 1.0
         ann_carry_pct = ann_carry * 100.0
 
         mean_abs = abs(mean)
@@ -2533,28 +2646,25 @@ def _funding_regime_summary(series, interval_hours=8):
         elif mean > 0.02 and slope < -0.01:
             squeeze_hint = "LONG_CROWDED_DRAWDOWN_RISK"
 
-        def clamp(x, lo, hi):
-            return max(lo, min(hi, x))
-
         crowding_score = None
         squeeze_score = None
         chop_score = None
 
         try:
-            crowding_strength = clamp(abs(mean) / 0.03, 0.0, 1.0)
-            trend_strength = clamp(abs(slope) / 0.02, 0.0, 1.0)
-            vol_strength = clamp(stdev / 0.20, 0.0, 1.0)
-            flip_strength = clamp(flips / 12.0, 0.0, 1.0)
+            crowding_strength = _clamp01(abs(mean) / 0.03)
+            trend_strength = _clamp01(abs(slope) / 0.02)
+            vol_strength = _clamp01(stdev / 0.20)
+            flip_strength = _clamp01(flips / 12.0)
 
             crowding_score = int(round(100.0 * (0.70 * crowding_strength + 0.30 * trend_strength)))
 
             squeeze_score = 0
             if mean < -0.02 and slope > 0.01:
-                squeeze_score = int(round(100.0 * clamp((abs(mean) / 0.05) * 0.70 + (slope / 0.03) * 0.30, 0.0, 1.0)))
+                squeeze_score = int(round(100.0 * _clamp01((abs(mean) / 0.05) * 0.70 + (slope / 0.03) * 0.30)))
             elif mean > 0.02 and slope < -0.01:
-                squeeze_score = int(round(100.0 * clamp((abs(mean) / 0.05) * 0.70 + (abs(slope) / 0.03) * 0.30, 0.0, 1.0)))
+                squeeze_score = int(round(100.0 * _clamp01((abs(mean) / 0.05) * 0.70 + (abs(slope) / 0.03) * 0.30)))
 
-            chop_score = int(round(100.0 * clamp(0.55 * flip_strength + 0.25 * vol_strength + 0.20 * (1.0 - trend_strength), 0.0, 1.0)))
+            chop_score = int(round(100.0 * _clamp01(0.55 * flip_strength + 0.25 * vol_strength + 0.20 * (1.0 - trend_strength))))
         except Exception:
             crowding_score = None
             squeeze_score = None
@@ -2584,24 +2694,16 @@ def _funding_regime_summary(series, interval_hours=8):
     except Exception:
         return None
 def normalize_funding_regime(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    payload = data
-    if hasattr(data, "data"):
-        try:
-            payload = getattr(data, "data")
-        except Exception:
-            payload = data
-    if hasattr(payload, "data"):
-        try:
-            payload = getattr(payload, "data")
-        except Exception:
-            pass
+    payload = _unwrap_response(_unwrap_response(data))
     if isinstance(payload, dict) and isinstance(payload.get("data"), list):
         arr = payload.get("data") or []
         series = []
         for it in arr:
             try:
                 t_ms = int(it.get("time"))
-                close = float(it.get("close"))
+                close = _to_float(it.get("close"))
+                if close is None:
+                    continue
                 series.append({"timestamp": int(t_ms / 1000), "value": close * 100.0})
             except Exception:
                 continue
@@ -2623,11 +2725,7 @@ def normalize_funding_regime(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
 
 
 def normalize_price_last_close(payload: Any) -> Optional[float]:
-    try:
-        if hasattr(payload, "data"):
-            payload = getattr(payload, "data")
-    except Exception:
-        pass
+    payload = _unwrap_response(payload)
 
     if isinstance(payload, dict) and isinstance(payload.get("data"), list):
         payload = payload.get("data")
@@ -2645,13 +2743,8 @@ def normalize_price_last_close(payload: Any) -> Optional[float]:
     return None
 
 
-from typing import Any, Optional
 def normalize_binance_funding_rate_last(payload: Any) -> Optional[dict]:
-    try:
-        if hasattr(payload, "data"):
-            payload = getattr(payload, "data")
-    except Exception:
-        pass
+    payload = _unwrap_response(payload)
     if isinstance(payload, dict) and isinstance(payload.get("data"), list):
         payload = payload.get("data")
     if isinstance(payload, dict) and isinstance(payload.get("data"), dict):
@@ -2673,11 +2766,9 @@ def normalize_binance_funding_rate_last(payload: Any) -> Optional[dict]:
     return {"funding_rate_pct": round(fr_pct, 6), "funding_time_ms": ts}
 
 def normalize_binance_open_interest(payload):
-    try:
-        if hasattr(payload, "data") and isinstance(getattr(payload, "data"), dict):
-            payload = payload.data
-    except Exception:
-        pass
+    inner = _unwrap_response(payload)
+    if isinstance(inner, dict):
+        payload = inner
     if not isinstance(payload, dict):
         return None
     v = payload.get("openInterest", None)
@@ -2688,7 +2779,8 @@ def normalize_binance_open_interest(payload):
     except Exception:
         return None
 
-def normalize_binance_oi_change_1h(payload):
+# Binance openInterestHist: % change between the last two bars (1h and 4h share this)
+def _binance_oi_pct_change(payload):
     if isinstance(payload, dict) and isinstance(payload.get("data"), list):
         payload = payload.get("data")
     if not isinstance(payload, list) or len(payload) < 2:
@@ -2709,23 +2801,8 @@ def normalize_binance_oi_change_1h(payload):
         return None
     return round(((last - prev) / prev) * 100.0, 4)
 
+def normalize_binance_oi_change_1h(payload):
+    return _binance_oi_pct_change(payload)
+
 def normalize_binance_oi_change_4h(payload):
-    if isinstance(payload, dict) and isinstance(payload.get("data"), list):
-        payload = payload.get("data")
-    if not isinstance(payload, list) or len(payload) < 2:
-        return None
-    a, b = payload[-2], payload[-1]
-    if not isinstance(a, dict) or not isinstance(b, dict):
-        return None
-    prev = a.get("sumOpenInterestValue", a.get("sumOpenInterest"))
-    last = b.get("sumOpenInterestValue", b.get("sumOpenInterest"))
-    if prev is None or last is None:
-        return None
-    try:
-        prev = float(prev)
-        last = float(last)
-    except Exception:
-        return None
-    if prev == 0:
-        return None
-    return round(((last - prev) / prev) * 100.0, 4)
+    return _binance_oi_pct_change(payload)
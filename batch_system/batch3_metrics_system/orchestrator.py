@@ -23,6 +23,11 @@ For implemented=True:
       value = normalized_value (float | dict | list)
 """
 
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Dict, Any, Optional, List
 from batch3_metrics_system.metric_definitions import MetricDefinition, MetricStatus
 from batch3_metrics_system.metric_registry import PANEL_REGISTRY, get_all_implemented_metrics
@@ -33,6 +38,39 @@ from batch2_engine.coinglass import CoinGlassAPI
 from batch2_engine.param_manager import normalize_params
 
 
+# ============================================================================
+# SHARED FETCH SLOT
+# ============================================================================
+
+class _SharedFetch:
+    """
+    One in-flight fetch shared by every caller of the same (endpoint, params)
+
+    The caller that creates the slot performs the fetch and must call
+    resolve() exactly once (success or exception); everyone else wait()s.
+    """
+    
+    __slots__ = ("_done", "_response", "_error")
+    
+    def __init__(self):
+        self._done = threading.Event()
+        self._response = None
+        self._error: Optional[BaseException] = None
+    
+    def resolve(self, response: Any = None, error: Optional[BaseException] = None):
+        """Publish the fetch outcome and release waiters"""
+        self._response = response
+        self._error = error
+        self._done.set()
+    
+    def wait(self) -> Any:
+        """Block until resolved; return the response or re-raise the fetch error"""
+        self._done.wait()
+        if self._error is not None:
+            raise self._error
+        return self._response
+
+
 # ============================================================================
 # METRIC RESULT MODEL
 # ============================================================================
@@ -53,6 +91,9 @@ class MetricResult:
     - error does NOT become a required field in JSON output
     - This prevents contract drift
     """
+
+    # One instance per metric per cycle; no per-instance __dict__ needed
+    __slots__ = ("metric_id", "status", "value", "error")
     
     def __init__(
         self,
@@ -93,7 +134,8 @@ class MetricOrchestrator:
     4. Handle errors gracefully (one metric failure doesn't affect others)
     """
     
-    def __init__(self, api_client: CoinGlassAPI):
+    def __init__(self, api_client: CoinGlassAPI, max_workers: Optional[int] = None,
+                 response_ttl: Optional[float] = None):
         """
         Initialize orchestrator with CoinGlass API client
         
@@ -104,8 +146,23 @@ class MetricOrchestrator:
         
         Args:
             api_client: CoinGlassAPI instance (real or mock)
+            max_workers: Worker threads for fetch_all_metrics (None/1 = serial)
+            response_ttl: Seconds to reuse a successful response for identical
+                (endpoint, params) across calls (None/0 = always fetch fresh)
         """
         self.api = api_client
+        self.max_workers = max_workers
+        self.response_ttl = response_ttl
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # Successful responses kept for response_ttl: key -> (monotonic_ts, response)
+        self._response_cache: Dict[tuple, tuple] = {}
+        
+        # metric_id -> MetricDefinition (ids are unique, validated at registry import)
+        self._metric_index: Dict[str, MetricDefinition] = self._build_metric_index()
+        
+        # Guards per-cycle share maps (the maps themselves live in fetch_metrics)
+        self._shared_lock = threading.Lock()
         
         # Map normalizer function names to actual functions
         self.normalizer_map = {
@@ -150,7 +207,8 @@ class MetricOrchestrator:
             'normalize_binance_oi_change_4h': normalizer.normalize_binance_oi_change_4h,
 }
     
-    def fetch_and_normalize(self, metric: MetricDefinition) -> MetricResult:
+    def fetch_and_normalize(self, metric: MetricDefinition,
+                            shared: Optional[Dict[tuple, _SharedFetch]] = None) -> MetricResult:
         """
         Fetch and normalize a single metric
         
@@ -161,6 +219,7 @@ class MetricOrchestrator:
         
         Args:
             metric: MetricDefinition from registry
+            shared: Cycle share map from fetch_metrics (None = standalone call)
         
         Returns:
             MetricResult with status and value
@@ -183,7 +242,7 @@ class MetricOrchestrator:
         # RULE 2: implemented=True => fetch + normalize + deterministic status
         
         # Step 1: Fetch raw data
-        raw_data = self._fetch_raw_data(metric)
+        raw_data = self._fetch_raw_data(metric, shared)
         if raw_data is None:
             # Fetch failed
             return MetricResult(
@@ -211,7 +270,8 @@ class MetricOrchestrator:
             value=normalized_value,
             error=None
         )
-    def _fetch_raw_data(self, metric: MetricDefinition) -> Optional[Any]:
+    def _fetch_raw_data(self, metric: MetricDefinition,
+                        shared: Optional[Dict[tuple, _SharedFetch]] = None) -> Optional[Any]:
         """
         Fetch raw data from current provider (CoinGlass, Binance, etc.)
 
@@ -222,7 +282,7 @@ class MetricOrchestrator:
         """
         try:
             if metric.fetch_plan:
-                return self._fetch_multi_endpoint(metric.fetch_plan)
+                return self._fetch_multi_endpoint(metric.fetch_plan, shared)
 
             params = metric.params or {}
             try:
@@ -231,7 +291,7 @@ class MetricOrchestrator:
             except Exception:
                 params = metric.params or {}
 
-            response = self.api.fetch(metric.endpoint, params)
+            response = self._fetch_shared(metric.endpoint, params, shared)
             if response is None:
                 return None
 
@@ -249,7 +309,73 @@ class MetricOrchestrator:
             return None
 
 
-    def _fetch_multi_endpoint(self, fetch_plan: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    def _fetch_shared(self, endpoint: str, params: Dict[str, Any],
+                      shared: Optional[Dict[tuple, _SharedFetch]] = None) -> Any:
+        """
+        Fetch an endpoint once per cycle for identical (endpoint, params)
+
+        Paired metrics (weekly_06/weekly_07 long/short liquidations) hit the
+        same endpoint with the same params. Sharing the response means one
+        API call, and both wrappers receive the same payload object, so the
+        memoized base normalizer parses it only once.
+
+        The first caller performs the fetch; concurrent callers for the same
+        key wait on its _SharedFetch slot. The share map belongs to one
+        fetch_metrics cycle and is passed down explicitly, so overlapping
+        cycles on one orchestrator never see each other's map. With
+        shared=None (standalone calls) this is a plain api.fetch().
+
+        With response_ttl set, a successful response is also reused across
+        calls and cycles until it is response_ttl seconds old.
+        """
+        ttl = self.response_ttl
+        if shared is None and not ttl:
+            return self.api.fetch(endpoint, params)
+
+        try:
+            key = (endpoint, tuple(sorted(params.items())))
+            hash(key)
+        except Exception:
+            return self.api.fetch(endpoint, params)
+
+        if ttl:
+            cached = self._response_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+
+        if shared is None:
+            return self._fetch_and_cache(key, endpoint, params)
+
+        with self._shared_lock:
+            slot = shared.get(key)
+            is_owner = slot is None
+            if is_owner:
+                slot = _SharedFetch()
+                shared[key] = slot
+
+        if is_owner:
+            # Owner always resolves the slot, even on error, so waiters never hang
+            try:
+                slot.resolve(response=self._fetch_and_cache(key, endpoint, params))
+            except Exception as e:
+                slot.resolve(error=e)
+
+        return slot.wait()
+
+    def _fetch_and_cache(self, key: tuple, endpoint: str, params: Dict[str, Any]) -> Any:
+        """
+        api.fetch(), remembering the response for response_ttl if it succeeded
+
+        Failed responses (success=False, None) are never cached, so an error
+        is retried on the next call instead of being replayed.
+        """
+        response = self.api.fetch(endpoint, params)
+        if self.response_ttl and response is not None and getattr(response, "success", True):
+            self._response_cache[key] = (time.monotonic(), response)
+        return response
+
+    def _fetch_multi_endpoint(self, fetch_plan: List[Dict[str, Any]],
+                              shared: Optional[Dict[tuple, _SharedFetch]] = None) -> Optional[Dict[str, Any]]:
         """
         Fetch multiple endpoints and combine results
 
@@ -258,12 +384,15 @@ class MetricOrchestrator:
 
         Args:
             fetch_plan: List of {"name": str, "endpoint": str, "params": dict}
+            shared: Cycle share map from fetch_metrics (None = standalone call)
 
         Returns:
             Combined dict: {"name1": raw_response1, "name2": raw_response2, ...}
             None if ANY fetch fails (all-or-nothing)
         """
-        combined = {}
+        names = []
+        endpoints = []
+        params_list = []
 
         for item in fetch_plan:
             name = item.get("name")
@@ -273,12 +402,20 @@ class MetricOrchestrator:
             if not name or not endpoint:
                 return None
 
+            names.append(name)
+            endpoints.append(endpoint)
             # Normalize params
-            normalized_params = normalize_params(params, endpoint)
+            params_list.append(normalize_params(params, endpoint))
 
-            # Fetch from API
-            response = self.api.fetch(endpoint, normalized_params)
+        # Fetch from API - serially within this metric; other metrics of the
+        # cycle still run concurrently on the shared pool (see fetch_metrics)
+        responses = [
+            self._fetch_shared(endpoint, params, shared)
+            for endpoint, params in zip(endpoints, params_list)
+        ]
 
+        combined = {}
+        for name, response in zip(names, responses):
             if response is None:
                 return None  # All-or-nothing: any failure => None
 
@@ -327,16 +464,78 @@ class MetricOrchestrator:
             timeframe: 'daily', 'weekly', or 'monthly'
         
         Returns:
-            List of MetricResult objects
+            List of MetricResult objects (registry order)
+        
+        Concurrency: see fetch_metrics
         """
-        metrics = PANEL_REGISTRY.get(timeframe, [])
-        results = []
+        return self.fetch_metrics(PANEL_REGISTRY.get(timeframe, []))
+    
+    def fetch_metrics(self, metrics: List[MetricDefinition]) -> List[MetricResult]:
+        """
+        Fetch and normalize a list of metrics as one cycle
         
-        for metric in metrics:
-            result = self.fetch_and_normalize(metric)
-            results.append(result)
+        Args:
+            metrics: MetricDefinitions to run (e.g. a CLI's picked subset)
         
-        return results
+        Returns:
+            List of MetricResult objects (same order as metrics)
+        
+        Concurrency:
+        - max_workers > 1: metrics run on a shared thread pool (I/O-bound fetch)
+        - Otherwise: serial, one metric after another
+        - Either way, identical (endpoint, params) fetches are shared (see _fetch_shared)
+        """
+        # Identical (endpoint, params) requests share one fetch this cycle.
+        # The map is local to this call, so concurrent cycles stay independent.
+        fetch = partial(self.fetch_and_normalize, shared={})
+        
+        executor = self._get_executor()
+        if executor is None:
+            return [fetch(metric) for metric in metrics]
+        
+        # map() preserves input order, so results stay aligned with metrics
+        return list(executor.map(fetch, metrics))
+    
+    def _get_executor(self) -> Optional[ThreadPoolExecutor]:
+        """
+        Lazily create the long-lived worker pool
+        
+        Returns:
+            ThreadPoolExecutor, or None when running serially
+        """
+        if not self.max_workers or self.max_workers <= 1:
+            return None
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+    
+    def clear_response_cache(self, metrics: Optional[List[MetricDefinition]] = None):
+        """
+        Drop responses kept for response_ttl
+        
+        Args:
+            metrics: Only drop responses for these metrics' endpoints
+                (fetch_plan endpoints included); None = drop everything
+        """
+        if metrics is None:
+            self._response_cache.clear()
+            return
+        
+        endpoints = set()
+        for metric in metrics:
+            if metric.endpoint:
+                endpoints.add(metric.endpoint)
+            for item in metric.fetch_plan or ():
+                endpoints.add(item.get("endpoint"))
+        for key in list(self._response_cache):
+            if key[0] in endpoints:
+                self._response_cache.pop(key, None)
+    
+    def close(self):
+        """Shut down the worker pool (if one was created)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
     
     def fetch_all_daily_metrics(self) -> List[MetricResult]:
         """
@@ -359,13 +558,24 @@ class MetricOrchestrator:
         Returns:
             MetricResult if metric found, None otherwise
         """
-        # Search for metric in registry
+        metric = self._metric_index.get(metric_id)
+        if metric is None:
+            # Registry may have grown since __init__; re-index once before giving up
+            self._metric_index = self._build_metric_index()
+            metric = self._metric_index.get(metric_id)
+            if metric is None:
+                return None
+        
+        return self.fetch_and_normalize(metric)
+    
+    @staticmethod
+    def _build_metric_index() -> Dict[str, MetricDefinition]:
+        """Index every registry metric by id (first occurrence wins, as the scan did)"""
+        index = {}
         for metrics in PANEL_REGISTRY.values():
             for metric in metrics:
-                if metric.id == metric_id:
-                    return self.fetch_and_normalize(metric)
-        
-        return None
+                index.setdefault(metric.id, metric)
+        return index
 
 
 # ============================================================================
@@ -379,7 +589,10 @@ class BatchOrchestrator:
     This is the high-level interface for getting a complete panel snapshot
     """
     
-    def __init__(self, api_client: CoinGlassAPI):
+    TIMEFRAMES = ('daily', 'weekly', 'monthly')
+    
+    def __init__(self, api_client: CoinGlassAPI, max_workers: Optional[int] = None,
+                 response_ttl: Optional[float] = None, snapshot_ttl: Optional[float] = None):
         """
         Initialize batch orchestrator
         
@@ -387,8 +600,19 @@ class BatchOrchestrator:
         
         Args:
             api_client: CoinGlassAPI instance (real or mock)
+            max_workers: Worker threads per timeframe (None/1 = serial)
+            response_ttl: Seconds to reuse successful responses (None = off)
+            snapshot_ttl: Seconds to reuse a whole fetch_all() result (None = off)
         """
-        self.orchestrator = MetricOrchestrator(api_client)
+        self.orchestrator = MetricOrchestrator(api_client, max_workers=max_workers,
+                                               response_ttl=response_ttl)
+        self.snapshot_ttl = snapshot_ttl
+        
+        # Last results per timeframe: timeframe -> (monotonic_ts at fetch start, results)
+        self._snapshots: Dict[str, tuple] = {}
+        
+        # One lock per timeframe, so a slow daily refresh never blocks weekly/monthly
+        self._snapshot_locks = {timeframe: threading.Lock() for timeframe in self.TIMEFRAMES}
     
     def fetch_all(self) -> Dict[str, List[MetricResult]]:
         """
@@ -401,12 +625,98 @@ class BatchOrchestrator:
                 'weekly': [MetricResult, ...],
                 'monthly': [MetricResult, ...]
             }
+        
+        With snapshot_ttl set, each timeframe's results are reused until they
+        are snapshot_ttl seconds old (see invalidate() to force a refresh).
+        Each timeframe has its own lock, held only around its check-and-refresh:
+        concurrent callers of an expired timeframe wait for the first caller's
+        refresh instead of stampeding, while fresh timeframes return at once.
+        """
+        if not self.snapshot_ttl:
+            return self._fetch_all_fresh()
+        
+        results = {}
+        refreshed = False
+        for timeframe in self.TIMEFRAMES:
+            snapshot, was_refreshed = self._get_snapshot(timeframe)
+            refreshed = refreshed or was_refreshed
+            # Fresh list per caller; MetricResult objects are shared
+            results[timeframe] = list(snapshot[1])
+        
+        if refreshed:
+            # Batch boundary: release payloads held by normalizer memo caches
+            normalizer.clear_payload_caches()
+        
+        return results
+    
+    def fetch_timeframe(self, timeframe: str) -> List[MetricResult]:
         """
-        return {
-            'daily': self.orchestrator.fetch_all_metrics('daily'),
-            'weekly': self.orchestrator.fetch_all_metrics('weekly'),
-            'monthly': self.orchestrator.fetch_all_metrics('monthly')
+        Fetch one timeframe, reusing its snapshot under snapshot_ttl
+        
+        Args:
+            timeframe: 'daily', 'weekly' or 'monthly'
+        
+        Returns:
+            List of MetricResult objects (registry order)
+        
+        Only this timeframe's lock is taken, so per-timeframe pollers never
+        wait on another timeframe's refresh.
+        """
+        if not self.snapshot_ttl:
+            return self.orchestrator.fetch_all_metrics(timeframe)
+        
+        snapshot, refreshed = self._get_snapshot(timeframe)
+        if refreshed:
+            normalizer.clear_payload_caches()
+        return list(snapshot[1])
+    
+    def invalidate(self, timeframe: Optional[str] = None):
+        """
+        Drop cached snapshots so the next fetch_all() refetches them
+        
+        Args:
+            timeframe: 'daily', 'weekly' or 'monthly' (None = all timeframes)
+        
+        Responses kept for response_ttl are dropped too (for that timeframe's
+        endpoints), so the refetch really goes to the API.
+        
+        A refresh already in flight is not interrupted; it stores its
+        (newly fetched) results when it completes.
+        """
+        if timeframe is None:
+            self._snapshots.clear()
+            self.orchestrator.clear_response_cache()
+            return
+        
+        self._snapshots.pop(timeframe, None)
+        self.orchestrator.clear_response_cache(PANEL_REGISTRY.get(timeframe, []))
+    
+    def _get_snapshot(self, timeframe: str) -> tuple:
+        """
+        Return (snapshot, refreshed) for one timeframe, refetching if expired
+        
+        Returns:
+            ((monotonic_ts, results), True if this call did the refetch)
+        """
+        with self._snapshot_locks[timeframe]:
+            snapshot = self._snapshots.get(timeframe)
+            if snapshot is not None and time.monotonic() - snapshot[0] < self.snapshot_ttl:
+                return snapshot, False
+            snapshot = (time.monotonic(), self.orchestrator.fetch_all_metrics(timeframe))
+            self._snapshots[timeframe] = snapshot
+            return snapshot, True
+    
+    def _fetch_all_fresh(self) -> Dict[str, List[MetricResult]]:
+        """Fetch every timeframe now (no snapshot reuse)"""
+        results = {
+            timeframe: self.orchestrator.fetch_all_metrics(timeframe)
+            for timeframe in self.TIMEFRAMES
         }
+        
+        # Batch boundary: release payloads held by normalizer memo caches
+        normalizer.clear_payload_caches()
+        
+        return results
     
     def fetch_implemented_only(self) -> List[MetricResult]:
         """
@@ -446,25 +756,15 @@ def get_status_summary(results: List[MetricResult]) -> Dict[str, int]:
             'external_required': int
         }
     """
-    summary = {
+    counts = Counter(result.status for result in results)
+    
+    return {
         'total': len(results),
-        'ok': 0,
-        'missing': 0,
-        'locked': 0,
-        'external_required': 0
+        'ok': counts[MetricStatus.OK],
+        'missing': counts[MetricStatus.MISSING],
+        'locked': counts[MetricStatus.LOCKED],
+        'external_required': counts[MetricStatus.EXTERNAL_REQUIRED]
     }
-    
-    for result in results:
-        if result.status == MetricStatus.OK:
-            summary['ok'] += 1
-        elif result.status == MetricStatus.MISSING:
-            summary['missing'] += 1
-        elif result.status == MetricStatus.LOCKED:
-            summary['locked'] += 1
-        elif result.status == MetricStatus.EXTERNAL_REQUIRED:
-            summary['external_required'] += 1
-    
-    return summary
 
 
 def filter_by_status(results: List[MetricResult], status: MetricStatus) -> List[MetricResult]:
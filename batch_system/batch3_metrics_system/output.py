@@ -1,19 +1,3 @@
-def _format_funding_regime_line(v: dict) -> str:
-    regime = v.get("regime", "N/A")
-    last_pct = v.get("last_pct", "N/A")
-    mean_pct = v.get("mean_pct", "N/A")
-    stdev_pct = v.get("stdev_pct", "N/A")
-    pos_ratio = v.get("pos_ratio", "N/A")
-    ann = v.get("ann_carry_pct", "N/A")
-    flips = v.get("flips", "N/A")
-    z = v.get("z_last", "N/A")
-    slope = v.get("slope_pct_per_bar", "N/A")
-    cum = v.get("cum_30_pct", "N/A")
-    hint = v.get("squeeze_risk_hint", None)
-    tail = "" if (hint in (None, "N/A", "")) else f" | hint={hint}"
-    return f"{regime} | last={last_pct}% | mean={mean_pct}% | stdev={stdev_pct} | pos={pos_ratio} | ann={ann}% | flips={flips} | z={z} | slope={slope} | cum30={cum}%{tail}"
-
-
 """
 Output Formatter - Batch 3
 JSON Contract v1 builder and text formatter for metric results
@@ -46,6 +30,12 @@ import json
 import math
 
 
+# Reused encoders: json.dumps() builds a fresh JSONEncoder on every call
+# whenever non-default options (indent, ensure_ascii) are passed
+_JSON_PRETTY = json.JSONEncoder(indent=2, ensure_ascii=False)
+_JSON_COMPACT = json.JSONEncoder(ensure_ascii=False)
+
+
 # ============================================================================
 # JSON CONTRACT V1 BUILDER
 # ============================================================================
@@ -71,28 +61,22 @@ class JSONContractBuilder:
         Returns:
             Sanitized value (NaN/inf replaced with None)
         """
-        if value is None:
-            return None
-        
-        # Float: check for NaN/inf
+        # Float: NaN/inf -> None (one isfinite() call covers both)
         if isinstance(value, float):
-            if math.isnan(value) or math.isinf(value):
-                return None
-            return value
+            return value if math.isfinite(value) else None
         
         # Dict: recursively sanitize values
-        elif isinstance(value, dict):
-            if unit == "funding_regime":
-                return "Funding Regime: " + _format_funding_regime_line(value)
-            return {k: JSONContractBuilder.sanitize_value(v) for k, v in value.items()}
+        if isinstance(value, dict):
+            sanitize = JSONContractBuilder.sanitize_value
+            return {k: sanitize(v) for k, v in value.items()}
         
         # List: recursively sanitize items
-        elif isinstance(value, list):
-            return [JSONContractBuilder.sanitize_value(item) for item in value]
+        if isinstance(value, list):
+            sanitize = JSONContractBuilder.sanitize_value
+            return [sanitize(item) for item in value]
         
-        # Other types: return as-is
-        else:
-            return value
+        # None and other types: return as-is
+        return value
     
     @staticmethod
     def build_metric_item(
@@ -210,10 +194,8 @@ class JSONContractBuilder:
         Returns:
             JSON string
         """
-        if pretty:
-            return json.dumps(output, indent=2, ensure_ascii=False)
-        else:
-            return json.dumps(output, ensure_ascii=False)
+        encoder = _JSON_PRETTY if pretty else _JSON_COMPACT
+        return encoder.encode(output)
 
 
 # ============================================================================
@@ -267,6 +249,16 @@ class TextFormatter:
         MetricStatus.LOCKED: "🔒",
         MetricStatus.EXTERNAL_REQUIRED: "🔗"
     }
+    
+    # Scalar format templates by unit (anything else: 4 decimals)
+    SCALAR_FORMATS = {
+        "percent": "{:+.2f}%",
+        "billion_usd": "${:.2f}B",
+        "million_usd": "${:.2f}M",
+        "ratio": "{:.3f}",
+    }
+    SCALAR_DEFAULT_FORMAT = "{:.4f}"
+    
     @staticmethod
     def format_value(value: Any, unit: str) -> str:
         """
@@ -283,16 +275,8 @@ class TextFormatter:
             return "N/A"
 
         if isinstance(value, (int, float)):
-            if unit == "percent":
-                return f"{value:+.2f}%"
-            elif unit == "billion_usd":
-                return f"${value:.2f}B"
-            elif unit == "million_usd":
-                return f"${value:.2f}M"
-            elif unit == "ratio":
-                return f"{value:.3f}"
-            else:
-                return f"{value:.4f}"
+            template = TextFormatter.SCALAR_FORMATS.get(unit, TextFormatter.SCALAR_DEFAULT_FORMAT)
+            return template.format(value)
 
         elif isinstance(value, dict):
             if unit == "funding_regime":
@@ -364,16 +348,16 @@ class TextFormatter:
         metrics = PANEL_REGISTRY.get(timeframe, [])
         result_map = {r.metric_id: r for r in results}
         
-        lines = []
-        lines.append(f"\n{'=' * 70}")
-        lines.append(f"{timeframe.upper()} METRICS")
-        lines.append(f"{'=' * 70}")
+        rule = '=' * 70
+        lines = [f"\n{rule}", f"{timeframe.upper()} METRICS", rule]
         
-        for metric in metrics:
-            result = result_map.get(metric.id)
-            if result:
-                line = TextFormatter.format_metric(metric, result, verbose)
-                lines.append(line)
+        # Registry order; format_metric bound once for the loop
+        format_metric = TextFormatter.format_metric
+        lines.extend([
+            format_metric(metric, result, verbose)
+            for metric in metrics
+            if (result := result_map.get(metric.id))
+        ])
         
         return "\n".join(lines)
     
@@ -483,7 +467,7 @@ def output_daily_only_json(
         JSON string
     """
     output = JSONContractBuilder.build_timeframe_output('daily', daily_results)
-    json_str = json.dumps({"daily": output}, indent=2 if pretty else None, ensure_ascii=False)
+    json_str = JSONContractBuilder.to_json_string({"daily": output}, pretty=pretty)
     
     if filepath:
         with open(filepath, 'w', encoding='utf-8') as f:
@@ -496,6 +480,11 @@ def output_daily_only_json(
 # VALIDATION UTILITIES
 # ============================================================================
 
+# JSON Contract v1 required keys (see module docstring)
+_REQUIRED_TIMEFRAMES = ('daily', 'weekly', 'monthly')
+_REQUIRED_FIELDS = frozenset({'id', 'name', 'timeframe', 'category', 'status', 'unit', 'value'})
+
+
 def validate_json_contract(output: Dict[str, Any]) -> bool:
     """
     Validate that output conforms to JSON Contract v1 schema
@@ -506,28 +495,23 @@ def validate_json_contract(output: Dict[str, Any]) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    required_timeframes = ['daily', 'weekly', 'monthly']
-    required_fields = ['id', 'name', 'timeframe', 'category', 'status', 'unit', 'value']
-    
     # Check top-level structure
     if not isinstance(output, dict):
         return False
     
-    for timeframe in required_timeframes:
+    for timeframe in _REQUIRED_TIMEFRAMES:
         if timeframe not in output:
             return False
         
         if not isinstance(output[timeframe], list):
             return False
         
-        # Check each metric item
+        # Check each metric item (keys view >= set: membership per field, no copy)
         for item in output[timeframe]:
             if not isinstance(item, dict):
                 return False
             
-            # Check required fields
-            for field in required_fields:
-                if field not in item:
-                    return False
+            if not item.keys() >= _REQUIRED_FIELDS:
+                return False
     
     return True
@@ -1,6 +1,7 @@
 import os
 import sys
-from datetime import datetime
+import time
+from collections import Counter
 
 from batch2_engine.provider_factory import get_api
 from batch3_metrics_system.orchestrator import MetricOrchestrator
@@ -53,25 +54,15 @@ WEEKLY_SKELETON_IDS = [
     "weekly_18_market_cap_rank_changes",
 ]
 
+# Registry lookups by id, built once at import
+DAILY_METRIC_MAP = {m.id: m for m in PANEL_REGISTRY.get("daily", [])}
+WEEKLY_METRIC_MAP = {m.id: m for m in PANEL_REGISTRY.get("weekly", [])}
+
 def pick_daily_minimal_metrics():
-    metrics = PANEL_REGISTRY.get("daily", [])
-    metric_map = {m.id: m for m in metrics}
-    picked = []
-    for mid in DAILY_MINIMAL_IDS:
-        m = metric_map.get(mid)
-        if m is not None:
-            picked.append(m)
-    return picked
+    return [DAILY_METRIC_MAP[mid] for mid in DAILY_MINIMAL_IDS if mid in DAILY_METRIC_MAP]
 
 def pick_weekly_skeleton_metrics():
-    metrics = PANEL_REGISTRY.get("weekly", [])
-    metric_map = {m.id: m for m in metrics}
-    picked = []
-    for mid in WEEKLY_SKELETON_IDS:
-        m = metric_map.get(mid)
-        if m is not None:
-            picked.append(m)
-    return picked
+    return [WEEKLY_METRIC_MAP[mid] for mid in WEEKLY_SKELETON_IDS if mid in WEEKLY_METRIC_MAP]
 
 def get_skeleton_status(metric):
     """
@@ -113,15 +104,28 @@ def main():
             print("  python3 batch_system/btc_cli.py")
             sys.exit(1)
         api = get_api()
-    orchestrator = MetricOrchestrator(api)
+
+    # FETCH_WORKERS=<n> -> metrics fetched concurrently per panel (default 1 = serial)
+    try:
+        fetch_workers = int(os.getenv("FETCH_WORKERS", "1").strip())
+    except ValueError:
+        fetch_workers = 1
+    orchestrator = MetricOrchestrator(api, max_workers=fetch_workers)
+    try:
+        _run_panels(orchestrator, data_mode)
+    finally:
+        # Shut down the worker pool on normal return, early exit or error
+        orchestrator.close()
+
+
+def _run_panels(orchestrator, data_mode):
+    """Fetch and print the daily, weekly and monthly panels"""
     metrics = pick_daily_minimal_metrics()
     
     if not metrics:
         print("ERROR: Could not find Daily Minimal metric IDs in PANEL_REGISTRY['daily'].")
         print("Next step: verify IDs in batch_system/batch3_metrics_system/metric_registry.py")
         sys.exit(2)
-    
-    results = []
 
     # FREE_SMOKE=1 -> fetch only 1 metric to avoid rate-limit while wiring free providers
     # Optional: FREE_SMOKE_ID=<metric_id> to pick a specific metric instead of the first one
@@ -133,13 +137,13 @@ def main():
         else:
             metrics = metrics[:1]
 
-    for metric in metrics:
-        results.append(orchestrator.fetch_and_normalize(metric))
+    # One concurrent cycle; results come back in metrics order
+    results = orchestrator.fetch_metrics(metrics)
     
     print("=" * 70)
     print("  BTC - GUNLUK SAVAS PANELI (DAILY MINIMAL)")
     print("=" * 70)
-    print("Timestamp: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    print("Timestamp: " + time.strftime("%Y-%m-%d %H:%M:%S"))
     
     panel_text = TextFormatter.format_timeframe("daily", results, verbose=True)
     print(panel_text)
@@ -168,38 +172,39 @@ def main():
     print("WEEKLY METRICS")
 
     weekly_metrics = pick_weekly_skeleton_metrics()
-    weekly_ok = 0
-    weekly_missing = 0
-    weekly_external = 0
-    weekly_locked = 0
+    # Panel status text -> count
+    weekly_counts = Counter()
 
     if not weekly_metrics:
         print("  [No weekly metrics found in registry]")
     else:
+        # Fetch real data for implemented metrics concurrently, then print in order
+        weekly_implemented = [m for m in weekly_metrics if m.implemented]
+        weekly_results = dict(zip(
+            [m.id for m in weekly_implemented],
+            orchestrator.fetch_metrics(weekly_implemented),
+        ))
+        lines = []
         for metric in weekly_metrics:
             if metric.implemented:
-                # Fetch real data for implemented metrics
-                result = orchestrator.fetch_and_normalize(metric)
+                result = weekly_results[metric.id]
                 if result.status == MetricStatus.OK:
-                    weekly_ok += 1
-                    print(f"  ✅ {metric.name}: {result.value}")
+                    weekly_counts["OK"] += 1
+                    lines.append(f"  ✅ {metric.name}: {result.value}")
                 else:
-                    weekly_missing += 1
-                    print(f"  ❌ {metric.name}: N/A [MISSING]")
+                    weekly_counts["MISSING"] += 1
+                    lines.append(f"  ❌ {metric.name}: N/A [MISSING]")
             else:
                 # Skeleton display for non-implemented metrics
                 symbol, status_text = get_skeleton_status(metric)
-                if status_text == "EXTERNAL_REQUIRED":
-                    weekly_external += 1
-                elif status_text == "LOCKED":
-                    weekly_locked += 1
-                else:
-                    weekly_missing += 1
-                print(f"  {symbol} {metric.name}: N/A [{status_text}]")
+                weekly_counts[status_text] += 1
+                lines.append(f"  {symbol} {metric.name}: N/A [{status_text}]")
+        # One write for the whole panel instead of one per metric
+        print("\n".join(lines))
 
     print("\n" + "-" * 70)
-    print(f"  WEEKLY SUMMARY: {weekly_ok}/{len(weekly_metrics)} metrics OK")
-    print(f"  ✅ OK: {weekly_ok} | ❌ MISSING: {weekly_missing} | 🔗 EXTERNAL: {weekly_external} | 🔒 LOCKED: {weekly_locked}")
+    print(f"  WEEKLY SUMMARY: {weekly_counts['OK']}/{len(weekly_metrics)} metrics OK")
+    print(f"  ✅ OK: {weekly_counts['OK']} | ❌ MISSING: {weekly_counts['MISSING']} | 🔗 EXTERNAL: {weekly_counts['EXTERNAL_REQUIRED']} | 🔒 LOCKED: {weekly_counts['LOCKED']}")
     print("=" * 70)
 
     # ========================================================================
@@ -211,38 +216,39 @@ def main():
     print("MONTHLY METRICS")
 
     monthly_metrics = PANEL_REGISTRY.get("monthly", [])
-    monthly_ok = 0
-    monthly_missing = 0
-    monthly_external = 0
-    monthly_locked = 0
+    # Panel status text -> count
+    monthly_counts = Counter()
 
     if not monthly_metrics:
         print("  [No monthly metrics found in registry]")
     else:
+        # Fetch real data for implemented metrics concurrently, then print in order
+        monthly_implemented = [m for m in monthly_metrics if m.implemented]
+        monthly_results = dict(zip(
+            [m.id for m in monthly_implemented],
+            orchestrator.fetch_metrics(monthly_implemented),
+        ))
+        lines = []
         for metric in monthly_metrics:
             if metric.implemented:
-                # Fetch real data for implemented metrics
-                result = orchestrator.fetch_and_normalize(metric)
+                result = monthly_results[metric.id]
                 if result.status == MetricStatus.OK:
-                    monthly_ok += 1
-                    print(f"  ✅ {metric.name}: {result.value}")
+                    monthly_counts["OK"] += 1
+                    lines.append(f"  ✅ {metric.name}: {result.value}")
                 else:
-                    monthly_missing += 1
-                    print(f"  ❌ {metric.name}: N/A [MISSING]")
+                    monthly_counts["MISSING"] += 1
+                    lines.append(f"  ❌ {metric.name}: N/A [MISSING]")
             else:
                 # Skeleton display for non-implemented metrics
                 symbol, status_text = get_skeleton_status(metric)
-                if status_text == "EXTERNAL_REQUIRED":
-                    monthly_external += 1
-                elif status_text == "LOCKED":
-                    monthly_locked += 1
-                else:
-                    monthly_missing += 1
-                print(f"  {symbol} {metric.name}: N/A [{status_text}]")
+                monthly_counts[status_text] += 1
+                lines.append(f"  {symbol} {metric.name}: N/A [{status_text}]")
+        # One write for the whole panel instead of one per metric
+        print("\n".join(lines))
 
     print("\n" + "-" * 70)
-    print(f"  MONTHLY SUMMARY: {monthly_ok}/{len(monthly_metrics)} metrics OK")
-    print(f"  ✅ OK: {monthly_ok} | ❌ MISSING: {monthly_missing} | 🔗 EXTERNAL: {monthly_external} | 🔒 LOCKED: {monthly_locked}")
+    print(f"  MONTHLY SUMMARY: {monthly_counts['OK']}/{len(monthly_metrics)} metrics OK")
+    print(f"  ✅ OK: {monthly_counts['OK']} | ❌ MISSING: {monthly_counts['MISSING']} | 🔗 EXTERNAL: {monthly_counts['EXTERNAL_REQUIRED']} | 🔒 LOCKED: {monthly_counts['LOCKED']}")
     print("=" * 70)
 
 
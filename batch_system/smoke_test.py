@@ -16,6 +16,8 @@ Usage:
 
 import sys
 import os
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 # Add current directory to path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -26,13 +28,54 @@ from batch2_engine.coinglass import CoinGlassAPI
 from batch3_metrics_system.orchestrator import MetricOrchestrator
 from batch3_metrics_system.metric_registry import PANEL_REGISTRY
 
+# metric_id -> MetricDefinition (ids are unique across timeframes)
+_METRIC_INDEX = {metric.id: metric for metrics in PANEL_REGISTRY.values() for metric in metrics}
+
+# |weighted funding| outside these bounds (percent) points to a scale bug
+FUNDING_SCALE_LOW = 0.0001
+FUNDING_SCALE_HIGH = 0.5
+
 def get_metric_by_id(metric_id):
     """Helper to find metric by ID"""
-    for timeframe, metrics in PANEL_REGISTRY.items():
-        for metric in metrics:
-            if metric.id == metric_id:
-                return metric
-    return None
+    return _METRIC_INDEX.get(metric_id)
+
+def print_summary(results):
+    """Print summary + funding scale check; True if all metrics passed"""
+    print(f"\n{'='*70}")
+    print("SMOKE TEST SUMMARY")
+    print(f"{'='*70}")
+    
+    passed = sum(1 for r in results if r[0] == "PASS")
+    print(f"\nRESULT: {passed}/{len(results)} PASSED")
+    
+    for status, metric_id, value in results:
+        emoji = "✅" if status == "PASS" else "❌" if status == "FAIL" else "⚠️"
+        value_str = f" → {value}" if value is not None else ""
+        print(f"{emoji} {metric_id}: {status}{value_str}")
+    
+    print("\n" + "="*70)
+    
+    # CRITICAL WARNING for funding rate
+    # (PASS rows always carry a non-None value)
+    funding_value = next(
+        (r[2] for r in results if r[1] == "daily_04_weighted_funding_rate" and r[0] == "PASS"),
+        None,
+    )
+    if funding_value is not None:
+        print("\n⚠️ FUNDING RATE SCALE CHECK:")
+        if isinstance(funding_value, (int, float)):
+            magnitude = abs(funding_value)
+            if magnitude > FUNDING_SCALE_HIGH:
+                print(f"❌ SUSPICIOUS: {funding_value}% is TOO HIGH (expected <0.2%)")
+                print("   → Likely scale issue. Send output to Helm immediately.")
+            elif magnitude < FUNDING_SCALE_LOW:
+                print(f"❌ SUSPICIOUS: {funding_value}% is TOO LOW (expected >0.001%)")
+                print("   → Likely scale issue. Send output to Helm immediately.")
+            else:
+                print(f"✅ OK: {funding_value}% is in expected range (0.001-0.2%)")
+        print("="*70)
+    
+    return passed == len(results)
 
 def smoke_test(api_key: str):
     """Run smoke test on 3 critical metrics"""
@@ -54,19 +97,30 @@ def smoke_test(api_key: str):
     
     results = []
     
+    # Start all fetches up front (I/O-bound); each result is read in the loop
+    # below so errors are still reported per metric, in test order
+    metric_defs = {metric_id: get_metric_by_id(metric_id) for metric_id in test_metrics}
+    executor = ThreadPoolExecutor(max_workers=len(test_metrics))
+    pending = {
+        metric_id: executor.submit(orchestrator.fetch_and_normalize, metric)
+        for metric_id, metric in metric_defs.items()
+        if metric is not None
+    }
+    executor.shutdown(wait=False)
+    
     for metric_id in test_metrics:
         print(f"\n{'='*70}")
         print(f"Testing: {metric_id}")
         print(f"{'='*70}")
         
         try:
-            metric = get_metric_by_id(metric_id)
+            metric = metric_defs[metric_id]
             if metric is None:
                 print(f"❌ FAIL - Metric not found in registry")
                 results.append(("FAIL", metric_id, None))
                 continue
                 
-            result = orchestrator.fetch_and_normalize(metric)
+            result = pending[metric_id].result()
             
             print(f"Status: {result.status.value}")
             print(f"Value: {result.value}")
@@ -87,41 +141,10 @@ def smoke_test(api_key: str):
                 
         except Exception as e:
             print(f"❌ EXCEPTION: {e}")
-            import traceback
             traceback.print_exc()
             results.append(("EXCEPTION", metric_id, None))
     
-    # Summary
-    print(f"\n{'='*70}")
-    print("SMOKE TEST SUMMARY")
-    print(f"{'='*70}")
-    
-    passed = sum(1 for r in results if r[0] == "PASS")
-    print(f"\nRESULT: {passed}/{len(results)} PASSED")
-    
-    for status, metric_id, value in results:
-        emoji = "✅" if status == "PASS" else "❌" if status == "FAIL" else "⚠️"
-        value_str = f" → {value}" if value is not None else ""
-        print(f"{emoji} {metric_id}: {status}{value_str}")
-    
-    print("\n" + "="*70)
-    
-    # CRITICAL WARNING for funding rate
-    if any(r[1] == "daily_04_weighted_funding_rate" and r[0] == "PASS" for r in results):
-        funding_value = next(r[2] for r in results if r[1] == "daily_04_weighted_funding_rate" and r[0] == "PASS")
-        print("\n⚠️ FUNDING RATE SCALE CHECK:")
-        if isinstance(funding_value, (int, float)):
-            if abs(funding_value) > 0.5:
-                print(f"❌ SUSPICIOUS: {funding_value}% is TOO HIGH (expected <0.2%)")
-                print("   → Likely scale issue. Send output to Helm immediately.")
-            elif abs(funding_value) < 0.0001:
-                print(f"❌ SUSPICIOUS: {funding_value}% is TOO LOW (expected >0.001%)")
-                print("   → Likely scale issue. Send output to Helm immediately.")
-            else:
-                print(f"✅ OK: {funding_value}% is in expected range (0.001-0.2%)")
-        print("="*70)
-    
-    return passed == len(results)
+    return print_summary(results)
 
 if __name__ == "__main__":
     # Get API key from environment or argument
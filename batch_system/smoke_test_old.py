@@ -16,6 +16,7 @@ Usage:
 
 import sys
 import os
+import traceback
 
 # Environment check (optional - helps debug dependency issues)
 try:
@@ -32,15 +33,8 @@ sys.path.insert(0, current_dir)
 
 from batch2_engine.coinglass import CoinGlassAPI
 from batch3_metrics_system.orchestrator import MetricOrchestrator
-from batch3_metrics_system.metric_registry import PANEL_REGISTRY
-
-def get_metric_by_id(metric_id: str):
-    """Helper to find metric by ID in registry"""
-    for timeframe, metrics in PANEL_REGISTRY.items():
-        for metric in metrics:
-            if metric.id == metric_id:
-                return metric
-    return None
+# Registry lookup and summary are shared with smoke_test.py
+from smoke_test import get_metric_by_id, print_summary
 
 def smoke_test(api_key: str):
     """Run smoke test on 3 critical metrics"""
@@ -74,17 +68,14 @@ def smoke_test(api_key: str):
             # DEBUG: For funding rate metrics only, print raw response if missing
             if metric_id in ["daily_04_weighted_funding_rate", "daily_05_funding_rate_history"] and result.status.value.lower() == "missing":
                 print(f"🔍 DEBUG - Fetching raw response for {metric_id}...")
-                debug_api = None
                 try:
-                    from batch2_engine.coinglass import CoinGlassAPI
-                    debug_api = CoinGlassAPI(api_key=api_key)
-                    
                     # Show endpoint and params being called
                     print(f"   Endpoint: {metric.endpoint}")
                     print(f"   Params: {metric.params}")
                     
+                    # Reuse the test client (and its pooled session) for the raw fetch;
                     # CoinGlassAPI.fetch already calls normalize_params internally
-                    debug_response = debug_api.fetch(metric.endpoint, metric.params)
+                    debug_response = api.fetch(metric.endpoint, metric.params)
                     
                     if debug_response and debug_response.success:
                         response_data = debug_response.data
@@ -109,13 +100,6 @@ def smoke_test(api_key: str):
                         print(f"   Fetch failed: success={debug_response.success if debug_response else 'None'}")
                 except Exception as debug_error:
                     print(f"   Debug fetch error: {debug_error}")
-                finally:
-                    # Cleanup: CoinGlassAPI.close() is recommended for proper resource management
-                    if debug_api is not None:
-                        try:
-                            debug_api.close()
-                        except Exception:
-                            pass  # Ignore cleanup errors
             
             print(f"Status: {result.status.value}")
             print(f"Value: {result.value}")
@@ -137,41 +121,10 @@ def smoke_test(api_key: str):
                 
         except Exception as e:
             print(f"❌ EXCEPTION: {e}")
-            import traceback
             traceback.print_exc()
             results.append(("EXCEPTION", metric_id, None))
     
-    # Summary
-    print(f"\n{'='*70}")
-    print("SMOKE TEST SUMMARY")
-    print(f"{'='*70}")
-    
-    passed = sum(1 for r in results if r[0] == "PASS")
-    print(f"\nRESULT: {passed}/{len(results)} PASSED")
-    
-    for status, metric_id, value in results:
-        emoji = "✅" if status == "PASS" else "❌" if status == "FAIL" else "⚠️"
-        value_str = f" → {value}" if value is not None else ""
-        print(f"{emoji} {metric_id}: {status}{value_str}")
-    
-    print("\n" + "="*70)
-    
-    # CRITICAL WARNING for funding rate
-    if any(r[1] == "daily_04_weighted_funding_rate" and r[0] == "PASS" for r in results):
-        funding_value = next(r[2] for r in results if r[1] == "daily_04_weighted_funding_rate" and r[0] == "PASS")
-        print("\n⚠️ FUNDING RATE SCALE CHECK:")
-        if isinstance(funding_value, (int, float)):
-            if abs(funding_value) > 0.5:
-                print(f"❌ SUSPICIOUS: {funding_value}% is TOO HIGH (expected <0.2%)")
-                print("   → Likely scale issue. Send output to Helm immediately.")
-            elif abs(funding_value) < 0.0001:
-                print(f"❌ SUSPICIOUS: {funding_value}% is TOO LOW (expected >0.001%)")
-                print("   → Likely scale issue. Send output to Helm immediately.")
-            else:
-                print(f"✅ OK: {funding_value}% is in expected range (0.001-0.2%)")
-        print("="*70)
-    
-    return passed == len(results)
+    return print_summary(results)
 
 if __name__ == "__main__":
     # Get API key from environment or argument
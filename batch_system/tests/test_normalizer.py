@@ -0,0 +1,308 @@
+"""
+Normalizer tests - Batch 3
+Field fallback rules for liquidation rows (_first_present), payload memoization,
+UTC date formatting and the latest / 7d-ago lookup
+
+Usage:
+    python3 -m unittest discover -s batch_system/tests
+"""
+
+import os
+import sys
+import unittest
+from datetime import datetime, timezone
+
+# Add batch_system root directory to sys.path for absolute imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch3_metrics_system import normalizer
+from batch3_metrics_system.normalizer import _first_present, _LONG_LIQ_KEYS
+
+
+class FirstPresentTest(unittest.TestCase):
+    """New-schema key wins unless missing; legacy keys are fallbacks"""
+
+    def test_empty_string_falls_back_to_legacy_key(self):
+        row = {"aggregated_long_liquidation_usd": "", "longLiquidationUsd": 5}
+        self.assertEqual(_first_present(row, _LONG_LIQ_KEYS), 5)
+
+    def test_none_falls_back_to_legacy_key(self):
+        row = {"aggregated_long_liquidation_usd": None, "longLiquidationUsd": 5}
+        self.assertEqual(_first_present(row, _LONG_LIQ_KEYS), 5)
+
+    def test_zero_is_a_real_reading(self):
+        row = {"aggregated_long_liquidation_usd": 0, "longLiquidationUsd": 5}
+        self.assertEqual(_first_present(row, _LONG_LIQ_KEYS), 0)
+        row = {"aggregated_long_liquidation_usd": "0", "longLiquidationUsd": 5}
+        self.assertEqual(_first_present(row, _LONG_LIQ_KEYS), "0")
+
+    def test_no_key_present_returns_zero(self):
+        self.assertEqual(_first_present({}, _LONG_LIQ_KEYS), 0)
+
+    def test_liquidations_total_recovers_blank_new_schema_field(self):
+        rows = [
+            {"aggregated_long_liquidation_usd": "", "longLiquidationUsd": 2e6,
+             "aggregated_short_liquidation_usd": 1e6}
+            for _ in range(6)
+        ]
+        result = normalizer.normalize_liquidations_total({"code": "0", "data": rows})
+        self.assertIsNotNone(result)
+        self.assertEqual(result["long"], 12.0)
+        self.assertEqual(result["short"], 6.0)
+
+
+class CoercionTest(unittest.TestCase):
+    """_to_float / _to_int: the one pair of numeric coercion helpers"""
+
+    def test_to_float(self):
+        self.assertEqual(normalizer._to_float(1.5), 1.5)
+        self.assertEqual(normalizer._to_float(2), 2.0)
+        self.assertIs(type(normalizer._to_float(2)), float)
+        self.assertEqual(normalizer._to_float("0.25"), 0.25)
+        for bad in (None, "", "x", [], {}):
+            self.assertIsNone(normalizer._to_float(bad), bad)
+
+    def test_to_int(self):
+        self.assertEqual(normalizer._to_int(7), 7)
+        self.assertEqual(normalizer._to_int("1768550400000"), 1768550400000)
+        for bad in (None, "", "x", "1.5"):
+            self.assertIsNone(normalizer._to_int(bad), bad)
+
+    def test_unparseable_field_fails_the_metric(self):
+        rows = [{"aggregated_long_liquidation_usd": 1e6, "aggregated_short_liquidation_usd": 1e6}
+                for _ in range(6)]
+        rows[2]["aggregated_long_liquidation_usd"] = "n/a"
+        self.assertIsNone(normalizer.normalize_liquidations_total({"code": "0", "data": rows}))
+
+
+class PayloadMemoTest(unittest.TestCase):
+    """_memoize_last_payload reuse and clear_payload_caches"""
+
+    def setUp(self):
+        self.calls = []
+
+        def base(data):
+            self.calls.append(data)
+            return len(data["data"])
+
+        self.memoized = normalizer._memoize_last_payload(base)
+        self.addCleanup(normalizer._MEMOIZED.remove, self.memoized)
+
+    def test_same_payload_object_is_parsed_once(self):
+        payload = {"code": "0", "data": [1, 2, 3]}
+        self.assertEqual(self.memoized(payload), 3)
+        self.assertEqual(self.memoized(payload), 3)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_equal_but_distinct_payload_is_parsed_again(self):
+        self.memoized({"code": "0", "data": [1]})
+        self.memoized({"code": "0", "data": [1]})
+        self.assertEqual(len(self.calls), 2)
+
+    def test_clear_payload_caches_drops_entry(self):
+        payload = {"code": "0", "data": [1, 2]}
+        self.memoized(payload)
+
+        normalizer.clear_payload_caches()
+        self.memoized(payload)
+
+        self.assertEqual(len(self.calls), 2)
+
+
+
+def reference_date(ts_sec):
+    """datetime's UTC calendar day for epoch seconds (the behaviour replaced)"""
+    return datetime.fromtimestamp(ts_sec, timezone.utc).date().isoformat()
+
+
+class UtcIsoDateTest(unittest.TestCase):
+    """_utc_iso_date / _utc_iso_date_ms / _epoch_day_iso against datetime"""
+
+    CASES = {
+        "epoch 0": 0,
+        "last second before epoch": -1,
+        "negative (1969-07-20)": -14182940,
+        "negative (1900-01-01)": -2208988800,
+        "leap day 2000-02-29": 951782400,
+        "leap day 2000-02-29 last second": 951868799,
+        "2100-02-28 (not a leap year)": 4107456000,
+        "2100-03-01": 4107542400,
+        "2024-02-29": 1709164800,
+        "year 9999 last day": 253402214400,
+    }
+
+    def test_known_dates_match_datetime(self):
+        for label, ts_sec in self.CASES.items():
+            with self.subTest(label):
+                self.assertEqual(normalizer._utc_iso_date(ts_sec), reference_date(ts_sec))
+
+    def test_leap_day_strings(self):
+        self.assertEqual(normalizer._utc_iso_date(951782400), "2000-02-29")
+        self.assertEqual(normalizer._utc_iso_date(4107456000), "2100-02-28")
+        self.assertEqual(normalizer._utc_iso_date(4107542400), "2100-03-01")
+
+    def test_sweep_matches_datetime(self):
+        # Every ~3.7 days from 1800 to 2300, offset so times of day vary
+        for ts_sec in range(-5364662400, 10413792000, 317_003):
+            self.assertEqual(normalizer._utc_iso_date(ts_sec), reference_date(ts_sec), ts_sec)
+
+    def test_millisecond_inputs(self):
+        for label, ts_sec in self.CASES.items():
+            with self.subTest(label):
+                ts_ms = ts_sec * 1000 + 999
+                self.assertEqual(normalizer._utc_iso_date_ms(ts_ms), reference_date(ts_sec))
+                self.assertEqual(normalizer._utc_iso_date_ms(str(ts_ms)), reference_date(ts_sec))
+
+    def test_millisecond_input_unformattable(self):
+        self.assertEqual(normalizer._utc_iso_date_ms(None), "")
+        self.assertEqual(normalizer._utc_iso_date_ms("not a timestamp"), "")
+        self.assertEqual(normalizer._utc_iso_date_ms(10 ** 20), "")
+
+    def test_to_seconds_accepts_seconds_and_milliseconds(self):
+        ts_sec = 1768550400
+        self.assertEqual(normalizer._to_seconds(ts_sec), ts_sec)
+        self.assertEqual(normalizer._to_seconds(ts_sec * 1000), ts_sec)
+
+    def test_out_of_range_raises_like_datetime(self):
+        with self.assertRaises(ValueError):
+            normalizer._utc_iso_date(253402300800)  # 10000-01-01
+
+    def test_epoch_day_cache_hits_return_datetime_value(self):
+        # lru_cache'd per day: repeated days are served from the cache unchanged
+        days = [-1, 0, 11016, 47541, 47542]  # 1969-12-31 .. 2100-03-01
+        for day in days:
+            normalizer._epoch_day_iso(day)
+        hits_before = normalizer._epoch_day_iso.cache_info().hits
+
+        for day in days:
+            self.assertEqual(normalizer._epoch_day_iso(day), reference_date(day * 86400))
+
+        self.assertEqual(normalizer._epoch_day_iso.cache_info().hits - hits_before, len(days))
+
+
+
+DAY_MS = 86_400_000
+
+
+def reference_latest_and_prev_7d(ts_list):
+    """Original scan: first max timestamp, then last index at or before latest - 7d"""
+    latest_idx = max(range(len(ts_list)), key=lambda i: ts_list[i])
+    target_ts = ts_list[latest_idx] - 7 * DAY_MS
+    for i in range(len(ts_list) - 1, -1, -1):
+        if ts_list[i] <= target_ts:
+            return latest_idx, i
+    return latest_idx, None
+
+
+class Latest7dLookupTest(unittest.TestCase):
+    """_latest_and_prev_7d_idx: bisect fast path vs out-of-order payloads"""
+
+    ORDERS = {
+        "ascending": [day * DAY_MS for day in range(11)],
+        "descending": [day * DAY_MS for day in reversed(range(11))],
+        "shuffled": [day * DAY_MS for day in (3, 0, 10, 7, 1, 9, 2, 8, 4, 6, 5)],
+        # First and last ascending, middle not: a first/last-only sortedness
+        # check would take the bisect path and pick the wrong 7d-ago row
+        "out-of-order middle": [0, 2 * DAY_MS, 9 * DAY_MS, 1 * DAY_MS, 10 * DAY_MS],
+        "duplicate latest": [0, 8 * DAY_MS, 8 * DAY_MS],
+        "no row old enough": [day * DAY_MS for day in range(5)],
+    }
+
+    def test_matches_reference_scan_for_any_order(self):
+        for label, ts_list in self.ORDERS.items():
+            with self.subTest(label):
+                self.assertEqual(normalizer._latest_and_prev_7d_idx(ts_list),
+                                 reference_latest_and_prev_7d(ts_list))
+
+    def test_ascending_bisect_path(self):
+        ts_list = self.ORDERS["ascending"]
+        self.assertEqual(normalizer._latest_and_prev_7d_idx(ts_list), (10, 3))
+
+    def test_out_of_order_middle_is_not_bisected(self):
+        # bisect on this list would return index 1 (day 2); the scan finds index 3
+        ts_list = self.ORDERS["out-of-order middle"]
+        self.assertEqual(normalizer._latest_and_prev_7d_idx(ts_list), (4, 3))
+
+    def test_fear_greed_unsorted_payload(self):
+        for label, ts_list in self.ORDERS.items():
+            with self.subTest(label):
+                values = [40 + ts // DAY_MS for ts in ts_list]
+                latest_idx, prev_idx = reference_latest_and_prev_7d(ts_list)
+                expected_change = (None if prev_idx is None
+                                   else float(values[latest_idx] - values[prev_idx]))
+                payload = {"code": "0", "data": {"data_list": values, "time_list": ts_list}}
+
+                result = normalizer.normalize_fear_greed_index(payload)
+
+                self.assertEqual(result["value"], values[latest_idx])
+                self.assertEqual(result["change_7d"], expected_change)
+
+    def test_assume_sorted_skips_to_bisect(self):
+        ts_list = self.ORDERS["ascending"]
+        self.assertEqual(normalizer._latest_and_prev_7d_idx(ts_list, assume_sorted=True),
+                         normalizer._latest_and_prev_7d_idx(ts_list))
+
+    def test_eth_btc_ratio_sorts_rows_once(self):
+        def history(price_of_day, days):
+            return {"code": "0", "data": [
+                {"time": day * DAY_MS, "close": str(price_of_day(day))} for day in days
+            ]}
+
+        ascending = list(range(11))
+        expected = {"value": round(1010 / 20100, 8),
+                    "change_7d": round(1010 / 20100 - 1003 / 20030, 8)}
+        for label, days in {"ascending": ascending,
+                            "descending": list(reversed(ascending))}.items():
+            with self.subTest(label):
+                payload = {
+                    "eth": history(lambda day: 1000 + day, days),
+                    "btc": history(lambda day: 20000 + 10 * day, days),
+                }
+                self.assertEqual(normalizer.normalize_eth_btc_ratio(payload), expected)
+
+
+class ActiveAddressesTest(unittest.TestCase):
+    """normalize_active_addresses_7d: mixed timestamp types and bad counts"""
+
+    BASE_TS = 1609459200
+
+    def payload(self, counts):
+        # Alternate str / int timestamps, newest first, as the API may mix them
+        rows = []
+        for day, count in reversed(list(enumerate(counts))):
+            ts_val = self.BASE_TS + day * 86400
+            rows.append({"timestamp": str(ts_val) if day % 2 else ts_val,
+                         "active_address_count": count})
+        return {"code": "0", "data": rows}
+
+    def test_mixed_str_and_int_timestamps(self):
+        counts = [1000.0 * (day + 1) for day in range(16)]
+        # Newest 14 days are days 2..15: prev7 = days 2..8, curr7 = days 9..15
+        result = normalizer.normalize_active_addresses_7d(self.payload(counts))
+        self.assertEqual(result, {"value": 13.0, "change_7d": 7.0})
+
+    def test_bad_count_in_window_falls_back_to_full_history(self):
+        counts = [1000.0 * (day + 1) for day in range(16)]
+        counts[10] = "n/a"
+        # Day 10 is dropped, so the window widens to days 1..15 without it:
+        # prev7 = days 1..7, curr7 = days 8, 9, 11..15
+        result = normalizer.normalize_active_addresses_7d(self.payload(counts))
+        expected_prev = sum(range(2, 9)) * 1000 / 7
+        expected_curr = (9 + 10 + 12 + 13 + 14 + 15 + 16) * 1000 / 7
+        self.assertEqual(result, {
+            "value": round(expected_curr / 1000, 2),
+            "change_7d": round((expected_curr - expected_prev) / 1000, 2),
+        })
+
+    def test_unparseable_timestamps_are_skipped(self):
+        counts = [1000.0] * 15
+        payload = self.payload(counts)
+        payload["data"][0]["timestamp"] = "not a timestamp"
+        self.assertEqual(normalizer.normalize_active_addresses_7d(payload),
+                         {"value": 1.0, "change_7d": 0.0})
+        payload["data"][1]["timestamp"] = None
+        self.assertIsNone(normalizer.normalize_active_addresses_7d(payload))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,520 @@
+"""
+Orchestrator tests - Batch 3
+Shared fetches, worker pool fan-out, result ordering, response TTL cache
+and BatchOrchestrator snapshots
+
+Usage:
+    python3 -m unittest discover -s batch_system/tests
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+# Add batch_system root directory to sys.path for absolute imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch2_engine.response_models import APIResponse
+from batch3_metrics_system.metric_definitions import MetricDefinition, MetricStatus
+from batch3_metrics_system import orchestrator as orchestrator_module
+from batch3_metrics_system.orchestrator import BatchOrchestrator, MetricOrchestrator
+
+# Upper bound for any wait in these tests; a hang fails instead of blocking forever
+JOIN_TIMEOUT = 5.0
+
+
+# ============================================================================
+# TEST DOUBLES
+# ============================================================================
+
+class FakeAPI:
+    """
+    Mock CoinGlassAPI: records every fetch and answers with a v4-style payload
+
+    The payload's close is endpoint_values[endpoint] billions, so
+    normalize_total_oi returns that number for the endpoint.
+    """
+
+    def __init__(self, endpoint_values=None, delays=None, error=None, response=APIResponse):
+        self.endpoint_values = endpoint_values or {}
+        self.delays = delays or {}
+        self.error = error
+        self.response = response  # fixed reply (e.g. None); APIResponse = build payload
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def fetch(self, endpoint, params):
+        with self._lock:
+            self.calls.append((endpoint, dict(params)))
+        time.sleep(self.delays.get(endpoint, 0))
+        if self.error is not None:
+            raise self.error
+        if self.response is not APIResponse:
+            return self.response
+        value = self.endpoint_values.get(endpoint, 1)
+        return APIResponse(
+            data={"code": "0", "data": [{"time": 1768550400000, "close": value * 1e9}]},
+            status_code=200,
+            success=True,
+        )
+
+
+# Panel -> canonical timeframe for test metric definitions
+PANEL_TIMEFRAMES = {"daily": "24h", "weekly": "7d", "monthly": "30d"}
+
+
+class FakeClock:
+    """Stands in for the orchestrator's time module; advance() moves monotonic()"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def make_metric(number, endpoint, params=None, panel="daily"):
+    """Implemented metric read through normalize_total_oi"""
+    return MetricDefinition(
+        id="%s_%02d_test_metric" % (panel, number),
+        name="Test metric %d" % number,
+        timeframe=PANEL_TIMEFRAMES[panel],
+        category="open_interest",
+        endpoint=endpoint,
+        params=params if params is not None else {"symbol": "BTC"},
+        implemented=True,
+        normalizer="normalize_total_oi",
+    )
+
+
+# ============================================================================
+# SHARED FETCHES + WORKER POOL
+# ============================================================================
+
+class SharedFetchTest(unittest.TestCase):
+    """Identical (endpoint, params) requests share one api.fetch per cycle"""
+
+    def test_identical_requests_fetch_once_serial(self):
+        api = FakeAPI()
+        orchestrator = MetricOrchestrator(api)
+        metrics = [make_metric(1, "/test/oi"), make_metric(2, "/test/oi")]
+
+        results = orchestrator.fetch_metrics(metrics)
+
+        self.assertEqual(len(api.calls), 1)
+        self.assertEqual([r.status for r in results], [MetricStatus.OK, MetricStatus.OK])
+
+    def test_identical_requests_fetch_once_concurrent(self):
+        api = FakeAPI(delays={"/test/oi": 0.05})
+        orchestrator = MetricOrchestrator(api, max_workers=4)
+        self.addCleanup(orchestrator.close)
+        metrics = [make_metric(n, "/test/oi") for n in range(1, 5)]
+
+        results = orchestrator.fetch_metrics(metrics)
+
+        self.assertEqual(len(api.calls), 1)
+        self.assertTrue(all(r.status == MetricStatus.OK for r in results))
+
+    def test_different_params_are_not_shared(self):
+        api = FakeAPI()
+        orchestrator = MetricOrchestrator(api)
+        metrics = [
+            make_metric(1, "/test/oi", {"symbol": "BTC"}),
+            make_metric(2, "/test/oi", {"symbol": "ETH"}),
+        ]
+
+        orchestrator.fetch_metrics(metrics)
+
+        self.assertEqual(len(api.calls), 2)
+
+    def test_owner_exception_reaches_every_waiter(self):
+        api = FakeAPI(delays={"/test/oi": 0.1}, error=RuntimeError("boom"))
+        orchestrator = MetricOrchestrator(api)
+        shared = {}
+        errors = []
+
+        def call():
+            try:
+                orchestrator._fetch_shared("/test/oi", {"symbol": "BTC"}, shared)
+            except RuntimeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(JOIN_TIMEOUT)
+
+        self.assertFalse(any(thread.is_alive() for thread in threads), "waiter hung")
+        self.assertEqual(len(api.calls), 1)
+        self.assertEqual(len(errors), 4)
+        self.assertTrue(all(e is errors[0] for e in errors))
+
+    def test_owner_exception_marks_all_sharing_metrics_missing(self):
+        api = FakeAPI(delays={"/test/oi": 0.05}, error=RuntimeError("boom"))
+        orchestrator = MetricOrchestrator(api, max_workers=4)
+        self.addCleanup(orchestrator.close)
+        metrics = [make_metric(n, "/test/oi") for n in range(1, 5)]
+
+        results = orchestrator.fetch_metrics(metrics)
+
+        self.assertEqual(len(api.calls), 1)
+        self.assertTrue(all(r.status == MetricStatus.MISSING for r in results))
+
+
+class CycleIsolationTest(unittest.TestCase):
+    """Each fetch_metrics call gets its own share map (no slots carried over)"""
+
+    def test_second_cycle_fetches_again(self):
+        api = FakeAPI()
+        orchestrator = MetricOrchestrator(api)
+        metrics = [make_metric(1, "/test/oi"), make_metric(2, "/test/oi")]
+
+        orchestrator.fetch_metrics(metrics)
+        orchestrator.fetch_metrics(metrics)
+
+        self.assertEqual(len(api.calls), 2)
+
+    def test_second_cycle_starts_with_fresh_share_map(self):
+        orchestrator = MetricOrchestrator(FakeAPI())
+        fetch_shared = orchestrator._fetch_shared
+        seen = []  # (share map, its keys before this fetch)
+
+        def spy(endpoint, params, shared=None):
+            seen.append((shared, set(shared or ())))
+            return fetch_shared(endpoint, params, shared)
+
+        orchestrator._fetch_shared = spy
+        metrics = [make_metric(1, "/test/oi")]
+        orchestrator.fetch_metrics(metrics)
+        orchestrator.fetch_metrics(metrics)
+
+        (first_map, _), (second_map, second_keys) = seen
+        self.assertIsNotNone(first_map)
+        self.assertIsNot(first_map, second_map)
+        self.assertEqual(second_keys, set())
+
+    def test_overlapping_cycle_keeps_its_share_map(self):
+        # Cycle A finishes while cycle B is still running; B's later paired
+        # metrics must still share one fetch (A must not clear B's map)
+        api = FakeAPI(delays={"/test/a": 0.1, "/test/b-slow": 0.2})
+        orchestrator = MetricOrchestrator(api)
+        cycle_a = [make_metric(1, "/test/a")]
+        cycle_b = [
+            make_metric(2, "/test/b-slow"),
+            make_metric(3, "/test/b-pair"),
+            make_metric(4, "/test/b-pair"),
+        ]
+        results = {}
+
+        threads = [
+            threading.Thread(target=lambda: results.setdefault("a", orchestrator.fetch_metrics(cycle_a))),
+            threading.Thread(target=lambda: results.setdefault("b", orchestrator.fetch_metrics(cycle_b))),
+        ]
+        for thread in threads:
+            thread.start()
+            time.sleep(0.03)
+        for thread in threads:
+            thread.join(JOIN_TIMEOUT)
+
+        self.assertEqual(sorted(call[0] for call in api.calls),
+                         ["/test/a", "/test/b-pair", "/test/b-slow"])
+        self.assertTrue(all(r.status == MetricStatus.OK for r in results["b"]))
+
+
+class WorkerPoolTest(unittest.TestCase):
+    """fetch_metrics fan-out on the long-lived pool"""
+
+    def test_results_keep_input_order_with_workers(self):
+        # Later metrics finish first; results must still follow input order
+        count = 6
+        endpoints = ["/test/oi/%d" % n for n in range(count)]
+        api = FakeAPI(
+            endpoint_values={endpoint: n + 1 for n, endpoint in enumerate(endpoints)},
+            delays={endpoint: 0.02 * (count - n) for n, endpoint in enumerate(endpoints)},
+        )
+        orchestrator = MetricOrchestrator(api, max_workers=count)
+        self.addCleanup(orchestrator.close)
+        metrics = [make_metric(n + 1, endpoint) for n, endpoint in enumerate(endpoints)]
+
+        results = orchestrator.fetch_metrics(metrics)
+
+        self.assertEqual([r.metric_id for r in results], [m.id for m in metrics])
+        self.assertEqual([r.value for r in results], [float(n + 1) for n in range(count)])
+
+    def test_serial_mode_creates_no_pool(self):
+        orchestrator = MetricOrchestrator(FakeAPI(), max_workers=1)
+
+        orchestrator.fetch_metrics([make_metric(1, "/test/oi")])
+
+        self.assertIsNone(orchestrator._executor)
+
+    def test_close_shuts_down_executor(self):
+        orchestrator = MetricOrchestrator(FakeAPI(), max_workers=2)
+        orchestrator.fetch_metrics([make_metric(1, "/test/a"), make_metric(2, "/test/b")])
+        executor = orchestrator._executor
+        self.assertIsNotNone(executor)
+
+        orchestrator.close()
+
+        self.assertIsNone(orchestrator._executor)
+        with self.assertRaises(RuntimeError):
+            executor.submit(int)
+
+    def test_pool_is_recreated_after_close(self):
+        orchestrator = MetricOrchestrator(FakeAPI(), max_workers=2)
+        self.addCleanup(orchestrator.close)
+        orchestrator.fetch_metrics([make_metric(1, "/test/a")])
+        orchestrator.close()
+
+        results = orchestrator.fetch_metrics([make_metric(1, "/test/a")])
+
+        self.assertEqual(results[0].status, MetricStatus.OK)
+
+
+
+# ============================================================================
+# RESPONSE TTL CACHE
+# ============================================================================
+
+class ResponseCacheTest(unittest.TestCase):
+    """response_ttl reuse of successful responses across calls and cycles"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(orchestrator_module, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_success_reused_within_ttl(self):
+        api = FakeAPI()
+        orchestrator = MetricOrchestrator(api, response_ttl=60)
+        metrics = [make_metric(1, "/test/oi")]
+
+        orchestrator.fetch_metrics(metrics)
+        self.clock.advance(59)
+        results = orchestrator.fetch_metrics(metrics)
+
+        self.assertEqual(len(api.calls), 1)
+        self.assertEqual(results[0].status, MetricStatus.OK)
+
+    def test_entry_expires_after_ttl(self):
+        api = FakeAPI()
+        orchestrator = MetricOrchestrator(api, response_ttl=60)
+        metrics = [make_metric(1, "/test/oi")]
+
+        orchestrator.fetch_metrics(metrics)
+        self.clock.advance(60)
+        orchestrator.fetch_metrics(metrics)
+
+        self.assertEqual(len(api.calls), 2)
+
+    def test_no_ttl_always_fetches(self):
+        api = FakeAPI()
+        orchestrator = MetricOrchestrator(api)
+        metrics = [make_metric(1, "/test/oi")]
+
+        orchestrator.fetch_metrics(metrics)
+        orchestrator.fetch_metrics(metrics)
+
+        self.assertEqual(len(api.calls), 2)
+        self.assertEqual(orchestrator._response_cache, {})
+
+    def test_failed_responses_are_never_cached(self):
+        failures = {
+            "none": None,
+            "non_success": APIResponse(data={"code": "40001"}, status_code=200,
+                                       success=False, error="API error"),
+        }
+        for label, response in failures.items():
+            with self.subTest(label):
+                api = FakeAPI(response=response)
+                orchestrator = MetricOrchestrator(api, response_ttl=60)
+                metrics = [make_metric(1, "/test/oi")]
+
+                orchestrator.fetch_metrics(metrics)
+                orchestrator.fetch_metrics(metrics)
+
+                self.assertEqual(len(api.calls), 2)
+                self.assertEqual(orchestrator._response_cache, {})
+
+    def test_exceptions_are_never_cached(self):
+        api = FakeAPI(error=RuntimeError("boom"))
+        orchestrator = MetricOrchestrator(api, response_ttl=60)
+        metrics = [make_metric(1, "/test/oi")]
+
+        orchestrator.fetch_metrics(metrics)
+        orchestrator.fetch_metrics(metrics)
+
+        self.assertEqual(len(api.calls), 2)
+        self.assertEqual(orchestrator._response_cache, {})
+
+    def test_clear_response_cache_drops_entries(self):
+        api = FakeAPI()
+        orchestrator = MetricOrchestrator(api, response_ttl=60)
+        first, second = make_metric(1, "/test/a"), make_metric(2, "/test/b")
+        orchestrator.fetch_metrics([first, second])
+
+        orchestrator.clear_response_cache([first])
+        orchestrator.fetch_metrics([first, second])
+        self.assertEqual([call[0] for call in api.calls], ["/test/a", "/test/b", "/test/a"])
+
+        orchestrator.clear_response_cache()
+        self.assertEqual(orchestrator._response_cache, {})
+
+    def test_invalidate_drops_cached_responses(self):
+        api = FakeAPI()
+        registry = {
+            "daily": [make_metric(1, "/test/daily")],
+            "weekly": [make_metric(1, "/test/weekly", panel="weekly")],
+            "monthly": [make_metric(1, "/test/monthly", panel="monthly")],
+        }
+        with mock.patch.dict(orchestrator_module.PANEL_REGISTRY, registry, clear=True):
+            batch = BatchOrchestrator(api, response_ttl=600, snapshot_ttl=600)
+            batch.fetch_all()
+
+            batch.invalidate("weekly")
+            batch.fetch_all()
+            self.assertEqual([call[0] for call in api.calls[3:]], ["/test/weekly"])
+
+            batch.invalidate()
+            batch.fetch_all()
+            self.assertEqual(len(api.calls), 7)
+
+
+
+# ============================================================================
+# BATCH ORCHESTRATOR SNAPSHOTS
+# ============================================================================
+
+class GatedAPI(FakeAPI):
+    """FakeAPI whose fetches for one endpoint block until release() is called"""
+
+    def __init__(self, gated_endpoint):
+        super().__init__()
+        self.gated_endpoint = gated_endpoint
+        self.entered = threading.Event()
+        self._gate = threading.Event()
+
+    def release(self):
+        self._gate.set()
+
+    def fetch(self, endpoint, params):
+        if endpoint == self.gated_endpoint:
+            self.entered.set()
+            self._gate.wait(JOIN_TIMEOUT)
+        return super().fetch(endpoint, params)
+
+
+class SnapshotTest(unittest.TestCase):
+    """Per-timeframe snapshot reuse, expiry, invalidation and locking"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patchers = [
+            mock.patch.object(orchestrator_module, "time", self.clock),
+            mock.patch.dict(orchestrator_module.PANEL_REGISTRY, {
+                "daily": [make_metric(1, "/test/daily")],
+                "weekly": [make_metric(1, "/test/weekly", panel="weekly")],
+                "monthly": [make_metric(1, "/test/monthly", panel="monthly")],
+            }, clear=True),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def fetched_endpoints(self, api, start=0):
+        return sorted(call[0] for call in api.calls[start:])
+
+    def test_snapshot_reused_within_ttl(self):
+        api = FakeAPI()
+        batch = BatchOrchestrator(api, snapshot_ttl=60)
+
+        first = batch.fetch_all()
+        self.clock.advance(59)
+        second = batch.fetch_all()
+
+        self.assertEqual(len(api.calls), 3)
+        self.assertEqual({tf: [r.to_dict() for r in results] for tf, results in first.items()},
+                         {tf: [r.to_dict() for r in results] for tf, results in second.items()})
+        # Callers get their own lists
+        self.assertIsNot(first["daily"], second["daily"])
+
+    def test_refetch_after_ttl_expires(self):
+        api = FakeAPI()
+        batch = BatchOrchestrator(api, snapshot_ttl=60)
+
+        batch.fetch_all()
+        self.clock.advance(60)
+        batch.fetch_all()
+
+        self.assertEqual(len(api.calls), 6)
+
+    def test_no_snapshot_ttl_always_fetches(self):
+        api = FakeAPI()
+        batch = BatchOrchestrator(api)
+
+        batch.fetch_all()
+        batch.fetch_all()
+
+        self.assertEqual(len(api.calls), 6)
+
+    def test_invalidate_one_timeframe(self):
+        api = FakeAPI()
+        batch = BatchOrchestrator(api, snapshot_ttl=60)
+        batch.fetch_all()
+
+        batch.invalidate("weekly")
+        batch.fetch_all()
+
+        self.assertEqual(self.fetched_endpoints(api, 3), ["/test/weekly"])
+
+    def test_invalidate_all_timeframes(self):
+        api = FakeAPI()
+        batch = BatchOrchestrator(api, snapshot_ttl=60)
+        batch.fetch_all()
+
+        batch.invalidate()
+        batch.fetch_all()
+
+        self.assertEqual(self.fetched_endpoints(api, 3),
+                         ["/test/daily", "/test/monthly", "/test/weekly"])
+
+    def test_fetch_timeframe_uses_only_its_snapshot(self):
+        api = FakeAPI()
+        batch = BatchOrchestrator(api, snapshot_ttl=60)
+
+        batch.fetch_timeframe("weekly")
+        batch.fetch_timeframe("weekly")
+
+        self.assertEqual(self.fetched_endpoints(api), ["/test/weekly"])
+
+    def test_slow_timeframe_does_not_block_another(self):
+        api = GatedAPI("/test/daily")
+        batch = BatchOrchestrator(api, snapshot_ttl=60)
+        daily = threading.Thread(target=batch.fetch_timeframe, args=("daily",))
+        daily.start()
+        self.addCleanup(daily.join, JOIN_TIMEOUT)
+        self.addCleanup(api.release)
+        self.assertTrue(api.entered.wait(JOIN_TIMEOUT))
+
+        weekly_results = []
+        weekly = threading.Thread(
+            target=lambda: weekly_results.extend(batch.fetch_timeframe("weekly"))
+        )
+        weekly.start()
+        weekly.join(JOIN_TIMEOUT)
+
+        self.assertFalse(weekly.is_alive(), "weekly waited on the daily refresh")
+        self.assertTrue(daily.is_alive())
+        self.assertEqual([r.status for r in weekly_results], [MetricStatus.OK])
+
+
+if __name__ == "__main__":
+    unittest.main()